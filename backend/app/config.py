@@ -78,6 +78,7 @@ class Settings(BaseSettings):
     # ═════════════════════════════════════════════════════════════════════════
     REDIS_URL: str = "redis://:yourpassword@localhost:6379/0"
     REDIS_DB_NUMBER: int = 0
+    REDIS_POOL_SIZE: int = 10
     REDIS_SOCKET_TIMEOUT: int = 5
     REDIS_SOCKET_CONNECT_TIMEOUT: int = 5
     CACHE_TTL: int = 3600
@@ -87,6 +88,7 @@ class Settings(BaseSettings):
     # ═════════════════════════════════════════════════════════════════════════
     EMBEDDING_MODEL: str = "text-embedding-004"
     EMBEDDING_DIMENSION: int = 768
+    EMBEDDING_CONCURRENCY: int = 8
     SIMILARITY_THRESHOLD: float = 0.7
     MAX_SEARCH_RESULTS: int = 5
     SEARCH_CACHE_TTL: int = 3600
@@ -115,6 +117,7 @@ class Settings(BaseSettings):
     # Gemini AI Configuration + RATE LIMITING
     # ═════════════════════════════════════════════════════════════════════════
     GEMINI_API_MODEL: str = "gemini-2.0-flash"
+    GEMINI_CONCURRENCY: int = 4
     GEMINI_TEMPERATURE: float = 0.7
     GEMINI_MAX_TOKENS: int = 2048
     GEMINI_RPM_LIMIT: int = RateLimits.RPM_LIMIT
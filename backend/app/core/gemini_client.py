@@ -29,6 +29,9 @@ class GeminiClient:
         self.request_count: int = 0
         self.daily_token_count: int = 0
         self.rate_limit_interval: float = RateLimits.REQUEST_INTERVAL
+        # Caps SDK calls in flight at once; each one occupies a worker
+        # thread for its full duration
+        self._semaphore = asyncio.Semaphore(settings.GEMINI_CONCURRENCY)
 
         try:
             import google.generativeai as genai
@@ -88,17 +91,18 @@ class GeminiClient:
                 return None
 
             # SET TIMEOUT
-            response = await asyncio.wait_for(
-                asyncio.to_thread(
-                    self.client.generate_content,
-                    prompt,
-                    generation_config={
-                        "temperature": temperature,
-                        "max_output_tokens": max_tokens,
-                    },
-                ),
-                timeout=float(Timeouts.GEMINI_REQUEST),
-            )
+            async with self._semaphore:
+                response = await asyncio.wait_for(
+                    asyncio.to_thread(
+                        self.client.generate_content,
+                        prompt,
+                        generation_config={
+                            "temperature": temperature,
+                            "max_output_tokens": max_tokens,
+                        },
+                    ),
+                    timeout=float(Timeouts.GEMINI_REQUEST),
+                )
 
             # Track tokens
             if hasattr(response, "usage_metadata"):
@@ -153,18 +157,19 @@ class GeminiClient:
 
             full_prompt = f"{system_instruction}\n\n{prompt}"
 
-            response = await asyncio.wait_for(
-                asyncio.to_thread(
-                    self.client.generate_content,
-                    full_prompt,
-                    generation_config={
-                        "temperature": temperature,
-                        "max_output_tokens": 2048,
-                        "response_mime_type": "application/json",
-                    },
-                ),
-                timeout=float(Timeouts.GEMINI_REQUEST),
-            )
+            async with self._semaphore:
+                response = await asyncio.wait_for(
+                    asyncio.to_thread(
+                        self.client.generate_content,
+                        full_prompt,
+                        generation_config={
+                            "temperature": temperature,
+                            "max_output_tokens": 2048,
+                            "response_mime_type": "application/json",
+                        },
+                    ),
+                    timeout=float(Timeouts.GEMINI_REQUEST),
+                )
 
             result = json.loads(response.text)
             logger.info(f"✅ Generated JSON response")
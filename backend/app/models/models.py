@@ -73,6 +73,13 @@ class Video(Model):
     
     class Meta:
         table = "videos"
+        # Matches the shipped migrations: one composite serves the
+        # channel+status listing queries (leading column covers
+        # channel-only filters), one serves status-across-channels
+        indexes = (
+            ("status", "created_at"),
+            ("channel_id", "status", "created_at"),
+        )
     
     def __str__(self) -> str:
         return f"<Video(id={self.id}, title='{self.title}', channel='{self.channel_id}', status='{self.status}')>"
@@ -90,6 +97,7 @@ class Source(Model):
     file_type = fields.CharField(max_length=20)  # pdf, docx, txt
     file_path = fields.CharField(max_length=500, null=True)
     file_size = fields.IntField(null=True)
+    content_hash = fields.CharField(max_length=64, null=True, unique=True)
     
     # ─────────────────────────────────────────────────────────────────────
     # Content
@@ -118,6 +126,7 @@ class Source(Model):
     
     class Meta:
         table = "sources"
+        indexes = (("created_at",),)
     
     def __str__(self) -> str:
         return f"<Source(id={self.id}, filename='{self.filename}', status='{self.status}')>"
@@ -157,6 +166,24 @@ class GenerationJob(Model):
     
     class Meta:
         table = "generation_jobs"
+        indexes = (("video_id", "status"),)
     
     def __str__(self) -> str:
         return f"<GenerationJob(id={self.id}, video_id={self.video_id}, status='{self.status}')>"
+
+
+class SourceEmbedding(Model):
+    """Per-chunk embedding vector for a source document."""
+    
+    id = fields.IntField(pk=True)
+    source_id = fields.IntField(index=True)
+    chunk_index = fields.IntField(default=0)
+    embedding = fields.JSONField()
+    
+    created_at = fields.DatetimeField(auto_now_add=True)
+    
+    class Meta:
+        table = "source_embeddings"
+    
+    def __str__(self) -> str:
+        return f"<SourceEmbedding(id={self.id}, source_id={self.source_id}, chunk={self.chunk_index})>"
@@ -4,6 +4,7 @@ Production-grade video generation orchestration with background task processing
 and real-time Gemini API logging
 """
 
+import hashlib
 import logging
 import yaml
 import tempfile
@@ -129,6 +130,8 @@ async def start_generation(request: VideoGenerationRequest):
         logger.info(f"✅ Sources found: {len(sources)}")
         
         # ✅ Create video record (Tortoise ORM - async)
+        # Single INSERT ... RETURNING round-trip: create directly in the
+        # processing state instead of create(pending) + re-fetch + save.
         logger.info(f"📝 Creating video record...")
         video = await Video.create(
             title=request.title,
@@ -139,17 +142,12 @@ async def start_generation(request: VideoGenerationRequest):
             category_metadata=channel_config.get("metadata"),
             custom_prompt=request.custom_prompt,
             prompt_config=request.channel_id,
-            status=VideoStatus.PENDING.value,
-            progress=0,
+            status=VideoStatus.PROCESSING.value,
+            progress=10,
         )
-        
+
         logger.info(f"✅ Video created: ID={video.id}, Status={video.status}")
         
-        # ✅ USE VIDEO GENERATION SERVICE
-        gen_service = get_video_generation_service()
-        await gen_service.mark_processing(video.id)
-        logger.info(f"✅ Video marked as processing")
-        
         # ✅ USE CACHE SERVICE
         cache_service = get_cache_service()
         await cache_service.set(f"video:{video.id}", {
@@ -323,10 +321,12 @@ async def cancel_generation(video_id: int):
         gen_service = get_video_generation_service()
         await gen_service.mark_failed(video_id, "Cancelled by user")
         
-        # ✅ USE CACHE SERVICE
+        # ✅ USE CACHE SERVICE - drop the cached GET /videos/{id} response
+        # too, or clients keep seeing the pre-cancel status until the TTL
         cache_service = get_cache_service()
         await cache_service.delete(f"video:{video_id}")
-        
+        await cache_service.delete(f"video:response:{video_id}")
+
         logger.info(f"✅ Video {video_id} cancelled")
         return {"status": "cancelled", "video_id": video_id}
     
@@ -353,13 +353,30 @@ async def analyze_content(source_id: int):
             logger.error(f"❌ Source has no content: {source_id}")
             raise HTTPException(status_code=400, detail="Source has no content")
         
-        # ✅ USE CONCEPT EXTRACTION SERVICE
-        concept_service = get_concept_extraction_service()
-        concepts = await concept_service.extract_concepts(source.content)
-        keywords = await concept_service.extract_keywords(source.content)
-        
-        # ✅ USE CACHE SERVICE
+        # ✅ USE CACHE SERVICE - keyed by content hash so unchanged
+        # content skips re-extraction and edits invalidate naturally
         cache_service = get_cache_service()
+        content_hash = hashlib.blake2b(
+            source.content.encode(), digest_size=16
+        ).hexdigest()
+        analysis_key = f"analysis:content:{content_hash}"
+
+        cached = await cache_service.get(analysis_key)
+        if cached:
+            logger.info(f"✅ Analysis cache hit for source {source_id}")
+            concepts = cached["concepts"]
+            keywords = cached["keywords"]
+        else:
+            # ✅ USE CONCEPT EXTRACTION SERVICE
+            concept_service = get_concept_extraction_service()
+            concepts = await concept_service.extract_concepts(source.content)
+            keywords = await concept_service.extract_keywords(source.content)
+
+            await cache_service.set(analysis_key, {
+                "concepts": concepts,
+                "keywords": keywords
+            }, ttl=86400)
+
         await cache_service.set(f"analysis:{source_id}", {
             "concepts": concepts,
             "keywords": keywords
@@ -467,7 +484,13 @@ async def force_complete_video(video_id: int):
             generation_time=120.5,
             quality_score=0.92
         )
-        
+
+        # ✅ Invalidate the cached GET /videos/{id} response so the new
+        # status is visible immediately
+        cache_service = get_cache_service()
+        await cache_service.delete(f"video:{video_id}")
+        await cache_service.delete(f"video:response:{video_id}")
+
         logger.info(f"✅ Video {video_id} force completed")
         return {
             "status": "success",
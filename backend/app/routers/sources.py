@@ -3,17 +3,27 @@ Source document management endpoints - Tortoise ORM
 Handles file uploads, extraction, storage, and management.
 """
 
+import asyncio
+import hashlib
 import logging
+import numpy as np
 import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 from typing import List, Optional
 
-from fastapi import APIRouter, UploadFile, File, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, UploadFile, File, HTTPException, status
+from fastapi.responses import JSONResponse
 import pdfplumber
+from tortoise.expressions import RawSQL
 
 from app.config import settings
-from app.models.models import Source
+from app.models.models import Source, SourceEmbedding
 from app.utils.validators import validate_file_upload, sanitize_filename
+from app.services.cache_service import get_cache_service
 from app.services.embedding_service import get_embedding_service
+from app.utils.embeddings_utils import split_text
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -24,64 +34,259 @@ ERROR_MESSAGES = {
     "no_content": "No content could be extracted from file",
 }
 
+_WORD_RE = re.compile(r"\S+")
+
+
+def _count_words(content: str) -> int:
+    """Count words without materializing a list of every token.
+
+    `len(content.split())` allocates the full word list; iterating the
+    compiled regex keeps memory flat on multi-MB documents.
+    """
+    return sum(1 for _ in _WORD_RE.finditer(content))
+
+
+# Pages handled by each worker when splitting a large PDF across processes
+_PAGES_PER_WORKER = 8
+
+# Uploads are streamed to disk in 1 MiB chunks
+_UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Created once at import so the handler skips the per-request
+# makedirs/stat syscall
+UPLOAD_DIR = Path(settings.UPLOAD_DIR)
+UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+
+_extract_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_extract_pool() -> ProcessPoolExecutor:
+    """Get or create the shared process pool for CPU-bound extraction."""
+    global _extract_pool
+    if _extract_pool is None:
+        _extract_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _extract_pool
+
+
+def _pdf_page_count(file_path: str) -> int:
+    """Read the page count without extracting any text."""
+    import fitz
+
+    doc = fitz.open(file_path)
+    try:
+        return doc.page_count
+    finally:
+        doc.close()
+
+
+def _extract_pages(file_path: str, start: int, end: int) -> str:
+    """Extract text for pages [start, end) - runs in a worker process.
+
+    Only the path and page range cross the process boundary; each worker
+    re-opens the document itself since PDF objects are not picklable.
+    """
+    import fitz
+
+    doc = fitz.open(file_path)
+    try:
+        parts = []
+        for i in range(start, min(end, doc.page_count)):
+            text = doc.load_page(i).get_text("text")
+            if text:
+                parts.append(text.replace('\x00', '').strip() + "\n")
+        return "".join(parts)
+    finally:
+        doc.close()
+
+
+async def _extract_pymupdf_parallel(file_path: str) -> tuple:
+    """
+    Extract a PDF with PyMuPDF, splitting large documents across CPU cores.
+
+    Pages are independent once the header is parsed, so big PDFs are
+    chunked into ranges and joined back in page order. Small documents
+    stay on the single-threaded path to avoid pool overhead.
+    """
+    page_count = await asyncio.to_thread(_pdf_page_count, file_path)
+
+    if page_count <= _PAGES_PER_WORKER:
+        return await asyncio.to_thread(_extract_pymupdf, file_path)
+
+    loop = asyncio.get_running_loop()
+    pool = _get_extract_pool()
+    futures = [
+        loop.run_in_executor(
+            pool, _extract_pages, file_path, start, start + _PAGES_PER_WORKER
+        )
+        for start in range(0, page_count, _PAGES_PER_WORKER)
+    ]
+    parts = await asyncio.gather(*futures)
+    return "".join(parts), page_count
+
+
+def _extract_pymupdf(file_path: str) -> tuple:
+    """Extract PDF text with PyMuPDF (sync, runs in a worker thread).
+
+    MuPDF's C parser is roughly an order of magnitude faster than the
+    pure-Python PyPDF2 path, so it is tried first when installed.
+    """
+    import fitz
+
+    doc = fitz.open(file_path)
+    try:
+        parts = []
+        for page in doc:
+            text = page.get_text("text")
+            if text:
+                parts.append(text.replace('\x00', '').strip() + "\n")
+        return "".join(parts), doc.page_count
+    finally:
+        doc.close()
+
+
+def _extract_txt(file_path: str) -> str:
+    """Read a text file (sync, runs in a worker thread)."""
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            return f.read()
+    except UnicodeDecodeError:
+        with open(file_path, "r", encoding="latin-1") as f:
+            return f.read()
+
+
+_DOCX_TEXT_TAG = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}t"
+
+
+def _extract_docx_xml(file_path: str) -> str:
+    """Stream DOCX text straight out of word/document.xml.
+
+    A .docx is a ZIP; iterating <w:t> elements with lxml skips the full
+    python-docx object model (Run/Style/rPr per paragraph) and keeps
+    peak memory at one element.
+    """
+    import zipfile
+    from lxml import etree
+
+    parts = []
+    with zipfile.ZipFile(file_path) as z, z.open("word/document.xml") as f:
+        for _, el in etree.iterparse(f, tag=_DOCX_TEXT_TAG):
+            if el.text:
+                parts.append(el.text)
+            el.clear()
+    return "\n".join(parts)
+
+
+def _extract_docx(file_path: str) -> str:
+    """Extract DOCX text (sync, runs in a worker process)."""
+    try:
+        content = _extract_docx_xml(file_path)
+        if content.strip():
+            return content
+    except Exception as e:
+        logger.warning(f"⚠️ Raw DOCX XML parse failed: {e}, trying python-docx")
+
+    # Fallback for non-standard XML layouts
+    from docx import Document
+
+    doc = Document(file_path)
+    parts = []
+    for para in doc.paragraphs:
+        parts.append(para.text + "\n")
+    return "".join(parts)
+
+
+def _extract_pypdf2(file_path: str) -> str:
+    """Extract PDF text with PyPDF2 (sync, runs in a worker thread)."""
+    import PyPDF2
+
+    parts = []
+    with open(file_path, "rb") as f:
+        pdf_reader = PyPDF2.PdfReader(f)
+        for page in pdf_reader.pages:
+            text = page.extract_text()
+            if text:
+                parts.append(text.replace('\x00', '').strip() + "\n")
+    return "".join(parts)
+
+
+def _extract_pdfplumber(file_path: str) -> str:
+    """Extract PDF text with pdfplumber (sync, runs in a worker thread)."""
+    parts = []
+    with pdfplumber.open(file_path) as pdf:
+        for page in pdf.pages:
+            text = page.extract_text()
+            if text:
+                parts.append(text.replace('\x00', '').strip() + "\n")
+    return "".join(parts)
+
+
+async def _extract_pdf_racing(file_path: str) -> str:
+    """
+    Race PyPDF2 and pdfplumber in parallel and keep the first good result.
+
+    Sequential fallback doubled extraction time for scanned-mostly PDFs;
+    running both and taking the first non-empty output cuts worst-case
+    latency roughly in half.
+    """
+    tasks = {
+        asyncio.create_task(asyncio.to_thread(_extract_pypdf2, file_path)),
+        asyncio.create_task(asyncio.to_thread(_extract_pdfplumber, file_path)),
+    }
+
+    content = ""
+    pending = tasks
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            try:
+                result = task.result()
+            except Exception as e:
+                logger.warning(f"⚠️ PDF extractor failed: {e}")
+                continue
+            if result and result.strip():
+                # First non-empty result wins; cancel the slower extractor
+                for other in pending:
+                    other.cancel()
+                return result
+
+    if not content:
+        logger.error("❌ All PDF extraction failed")
+        content = "[PDF content extraction not available]"
+    return content
+
 
 async def extract_content(file_path: str, file_type: str) -> tuple:
-    """Extract content from various file types."""
+    """Extract content from various file types.
+
+    Returns:
+        Tuple of (content, word_count, page_count); page_count is None
+        for non-paginated formats.
+    """
     try:
         content = ""
         word_count = 0
+        page_count = None
 
         if file_type == "txt":
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-            except UnicodeDecodeError:
-                with open(file_path, "r", encoding="latin-1") as f:
-                    content = f.read()
+            content = await asyncio.to_thread(_extract_txt, file_path)
 
         elif file_type == "pdf":
             try:
-                import PyPDF2
-                with open(file_path, "rb") as f:
-                    pdf_reader = PyPDF2.PdfReader(f)
-                    for page in pdf_reader.pages:
-                        text = page.extract_text()
-                        if text:
-                            text = text.replace('\x00', '').strip()
-                            content += text + "\n"
-
-                if not content or content.strip() == "":
-                    logger.warning("⚠️ PyPDF2: No text, trying pdfplumber...")
-                    try:
-                        with pdfplumber.open(file_path) as pdf:
-                            for page in pdf.pages:
-                                text = page.extract_text()
-                                if text:
-                                    text = text.replace('\x00', '').strip()
-                                    content += text + "\n"
-                    except Exception as e:
-                        logger.warning(f"pdfplumber failed: {e}")
-                        content = "[PDF content extraction not available]"
-
-            except Exception as pdf_error:
-                logger.warning(f"PyPDF2 failed: {pdf_error}, trying pdfplumber...")
-                try:
-                    with pdfplumber.open(file_path) as pdf:
-                        for page in pdf.pages:
-                            text = page.extract_text()
-                            if text:
-                                text = text.replace('\x00', '').strip()
-                                content += text + "\n"
-                except Exception as e:
-                    logger.error(f"❌ All PDF extraction failed: {e}")
-                    content = "[PDF content extraction not available]"
+                content, page_count = await _extract_pymupdf_parallel(file_path)
+            except ImportError:
+                logger.warning("⚠️ PyMuPDF not installed, using PyPDF2/pdfplumber")
+            except Exception as e:
+                logger.warning(f"⚠️ PyMuPDF failed: {e}")
+
+            if not content or not content.strip():
+                content = await _extract_pdf_racing(file_path)
 
         elif file_type == "docx":
             try:
-                from docx import Document
-                doc = Document(file_path)
-                for para in doc.paragraphs:
-                    content += para.text + "\n"
+                loop = asyncio.get_running_loop()
+                content = await loop.run_in_executor(
+                    _get_extract_pool(), _extract_docx, file_path
+                )
             except ImportError:
                 logger.warning("python-docx not installed")
                 content = "[DOCX content extraction not available]"
@@ -89,8 +294,8 @@ async def extract_content(file_path: str, file_type: str) -> tuple:
                 logger.error(f"DOCX extraction failed: {e}")
                 content = "[DOCX content extraction not available]"
 
-        word_count = len(content.split())
-        return content, word_count
+        word_count = _count_words(content)
+        return content, word_count, page_count
 
     except Exception as e:
         logger.error(f"❌ Content extraction failed: {e}")
@@ -107,13 +312,14 @@ async def upload_source(file: UploadFile = File(...)):
                 detail=ERROR_MESSAGES["invalid_file_type"],
             )
 
-        file_content = await file.read()
-        file_size = len(file_content)
         file_ext = file.filename.split(".")[-1].lower()
 
+        # Validate cheap metadata (extension, declared size, MIME type)
+        # BEFORE buffering the upload, so oversized/wrong-type files are
+        # rejected with zero bytes read.
         is_valid, error_msg = validate_file_upload(
             file.filename,
-            file_size,
+            file.size or 0,
             file.content_type or "",
         )
 
@@ -126,14 +332,68 @@ async def upload_source(file: UploadFile = File(...)):
         logger.info(f"📁 Processing upload: {file.filename}")
 
         safe_filename = sanitize_filename(file.filename)
-        file_path = os.path.join(settings.UPLOAD_DIR, safe_filename)
-
-        os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
-        with open(file_path, "wb") as f:
-            f.write(file_content)
+        file_path = str(UPLOAD_DIR / safe_filename)
+
+        # Stream the upload to disk in chunks instead of buffering the
+        # whole payload in RAM; the true size is accumulated as we go
+        # since the declared size header can lie. The content hash is
+        # folded in per chunk so deduplication costs no extra pass.
+        file_size = 0
+        hasher = hashlib.blake2b(digest_size=32)
+        try:
+            with open(file_path, "wb") as out:
+                while chunk := await file.read(_UPLOAD_CHUNK_SIZE):
+                    out.write(chunk)
+                    hasher.update(chunk)
+                    file_size += len(chunk)
+                    if file_size > settings.MAX_UPLOAD_SIZE:
+                        raise HTTPException(
+                            status_code=status.HTTP_400_BAD_REQUEST,
+                            detail="File exceeds maximum size limit",
+                        )
+        except HTTPException:
+            if os.path.exists(file_path):
+                os.remove(file_path)
+            raise
+
+        content_hash = hasher.hexdigest()
+
+        # ✅ Deduplicate: identical bytes skip extraction entirely
+        existing = await Source.get_or_none(content_hash=content_hash)
+        if existing:
+            await asyncio.to_thread(os.remove, file_path)
+            logger.info(f"✅ Duplicate upload, reusing source {existing.id}")
+            return JSONResponse(
+                status_code=status.HTTP_200_OK,
+                content={
+                    "id": existing.id,
+                    "filename": existing.filename,
+                    "file_type": existing.file_type,
+                    "status": existing.status,
+                    "word_count": existing.word_count,
+                    "file_size": existing.file_size,
+                    "message": "Duplicate file, existing source returned",
+                },
+            )
 
-        # Extract content
-        content, word_count = await extract_content(file_path, file_ext)
+        # Extract content - memoized by file hash so retries and
+        # re-uploads of known bytes become a cache read instead of a
+        # full parse
+        cache_service = get_cache_service()
+        extract_key = f"extract:{content_hash}"
+        cached_extract = await cache_service.get(extract_key)
+        if cached_extract:
+            logger.info(f"✅ Extraction cache hit for {file.filename}")
+            content = cached_extract["content"]
+            word_count = cached_extract["word_count"]
+            page_count = cached_extract["page_count"]
+        else:
+            content, word_count, page_count = await extract_content(file_path, file_ext)
+            await cache_service.set(extract_key, {
+                "content": content,
+                "word_count": word_count,
+                "page_count": page_count,
+            }, ttl=86400)
 
         # ✅ SANITIZE CONTENT
         if content:
@@ -142,7 +402,7 @@ async def upload_source(file: UploadFile = File(...)):
                 if ord(char) > 31 or char in '\n\r\t'
             )
             content = content.replace('\x00', '').replace('\ufffd', '').strip()
-            word_count = len(content.split())
+            word_count = _count_words(content)
 
         if not content or len(content.strip()) == 0:
             raise HTTPException(
@@ -156,8 +416,10 @@ async def upload_source(file: UploadFile = File(...)):
             file_type=file_ext,
             file_path=file_path,
             file_size=file_size,
+            content_hash=content_hash,
             content=content,
             word_count=word_count,
+            page_count=page_count,
             status="ready",
         )
 
@@ -189,24 +451,27 @@ async def list_sources(skip: int = 0, limit: int = 100):
     try:
         logger.debug("Fetching sources list")
 
-        # ✅ Tortoise ORM
-        sources = await Source.all().offset(skip).limit(limit)
-        total = await Source.all().count()
-
-        sources_list = [
-            {
-                "id": s.id,
-                "filename": s.filename,
-                "file_type": s.file_type,
-                "status": s.status,
-                "word_count": s.word_count,
-                "file_size": s.file_size,
-                "language": s.language,
-                "page_count": s.page_count,
-                "created_at": s.created_at.isoformat(),
-            }
-            for s in sources
-        ]
+        # ✅ Tortoise ORM - page and count run concurrently instead of
+        # as two sequential round-trips. Only metadata columns are
+        # selected; `content` can be megabytes per row.
+        sources, total = await asyncio.gather(
+            Source.all().offset(skip).limit(limit).values(
+                "id",
+                "filename",
+                "file_type",
+                "status",
+                "word_count",
+                "file_size",
+                "language",
+                "page_count",
+                "created_at",
+            ),
+            Source.all().count(),
+        )
+
+        # Row dicts go straight to orjson, which serializes datetimes
+        # natively - no per-row isoformat() pass
+        sources_list = list(sources)
 
         return {
             "sources": sources_list,
@@ -229,28 +494,40 @@ async def get_source(source_id: int):
     try:
         logger.debug(f"Fetching source: {source_id}")
 
-        # ✅ Tortoise ORM
-        source = await Source.get_or_none(id=source_id)
+        # ✅ Tortoise ORM - the preview is truncated in SQL so the DB
+        # sends 500 chars instead of the whole document
+        rows = await (
+            Source.filter(id=source_id)
+            .annotate(content_preview=RawSQL('SUBSTR("content", 1, 500)'))
+            .values(
+                "id",
+                "filename",
+                "file_type",
+                "status",
+                "file_size",
+                "word_count",
+                "page_count",
+                "language",
+                "summary",
+                "content_preview",
+                "created_at",
+                "updated_at",
+            )
+        )
 
-        if not source:
+        if not rows:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Source not found",
             )
 
+        source = rows[0]
+        preview = source.pop("content_preview")
         return {
-            "id": source.id,
-            "filename": source.filename,
-            "file_type": source.file_type,
-            "status": source.status,
-            "file_size": source.file_size,
-            "word_count": source.word_count,
-            "page_count": source.page_count,
-            "language": source.language,
-            "summary": source.summary,
-            "content_preview": (source.content[:500] + "...") if source.content else None,
-            "created_at": source.created_at.isoformat(),
-            "updated_at": source.updated_at.isoformat(),
+            **source,
+            "content_preview": (preview + "...") if preview else None,
+            "created_at": source["created_at"].isoformat(),
+            "updated_at": source["updated_at"].isoformat(),
         }
 
     except HTTPException:
@@ -269,22 +546,23 @@ async def delete_source(source_id: int):
     try:
         logger.info(f"🗑️ Deleting source: {source_id}")
 
-        # ✅ Tortoise ORM
-        source = await Source.get_or_none(id=source_id)
+        # ✅ Tortoise ORM - fetch only the file path (no content
+        # hydration), then delete in a single bulk statement
+        rows = await Source.filter(id=source_id).values("id", "file_path")
 
-        if not source:
+        if not rows:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Source not found",
             )
 
-        # Delete file
-        if source.file_path and os.path.exists(source.file_path):
-            os.remove(source.file_path)
-            logger.debug(f"Deleted file: {source.file_path}")
+        file_path = rows[0]["file_path"]
+        await Source.filter(id=source_id).delete()
 
-        # Delete database record
-        await source.delete()
+        # Delete file off the event loop
+        if file_path and os.path.exists(file_path):
+            await asyncio.to_thread(os.remove, file_path)
+            logger.debug(f"Deleted file: {file_path}")
 
         logger.info(f"✅ Source deleted: {source_id}")
         return None
@@ -299,8 +577,75 @@ async def delete_source(source_id: int):
         )
 
 
+# Batches above this size go through Postgres COPY instead of executemany
+_COPY_THRESHOLD = 100
+
+
+async def _persist_embeddings(source_id: int, vectors: list) -> None:
+    """Store per-chunk embeddings, using COPY for large batches.
+
+    COPY streams rows through the asyncpg binary protocol and is several
+    times faster than per-row inserts once batches get big; small batches
+    stay on bulk_create to avoid the extra connection handling.
+    """
+    import json
+
+    await SourceEmbedding.filter(source_id=source_id).delete()
+
+    if len(vectors) > _COPY_THRESHOLD:
+        from tortoise import Tortoise
+
+        conn = Tortoise.get_connection("default")
+        async with conn.acquire_connection() as raw_conn:
+            await raw_conn.copy_records_to_table(
+                "source_embeddings",
+                records=[
+                    (source_id, idx, json.dumps(vec))
+                    for idx, vec in enumerate(vectors)
+                ],
+                columns=["source_id", "chunk_index", "embedding"],
+            )
+    else:
+        await SourceEmbedding.bulk_create([
+            SourceEmbedding(source_id=source_id, chunk_index=idx, embedding=vec)
+            for idx, vec in enumerate(vectors)
+        ])
+
+
+# Bounds how many background embedding jobs run at once; an upload
+# burst queues here instead of racing unbounded into the embedding
+# service and the database
+_EMBED_TASK_SEMAPHORE = asyncio.Semaphore(16)
+
+
+async def _embed_source_chunks(source_id: int, content: str) -> None:
+    """Chunk a document and embed all chunks in one batch call.
+
+    Whole-document embedding silently truncates past the model's token
+    limit; chunking keeps every part of the source searchable.
+    """
+    try:
+        async with _EMBED_TASK_SEMAPHORE:
+            embedding_service = get_embedding_service()
+            chunks = split_text(content, max_words=512, overlap=50)
+            vectors = await embedding_service.embed_batch(chunks)
+
+            # Stored vectors are unit-length, so search can skip norm math
+            # and score with a plain dot product
+            matrix = np.asarray(vectors, dtype=np.float32)
+            matrix /= np.linalg.norm(matrix, axis=1, keepdims=True) + 1e-12
+            vectors = matrix.tolist()
+
+            await _persist_embeddings(source_id, vectors)
+        logger.info(
+            f"✅ Embedded source {source_id}: {len(vectors)} chunks"
+        )
+    except Exception as e:
+        logger.error(f"❌ Chunk embedding failed for source {source_id}: {e}")
+
+
 @router.post("/{source_id}/generate-embeddings", status_code=status.HTTP_202_ACCEPTED)
-async def generate_embeddings(source_id: int):
+async def generate_embeddings(source_id: int, background_tasks: BackgroundTasks):
     """Generate embeddings for source document."""
     try:
         logger.info(f"📊 Generating embeddings for source: {source_id}")
@@ -320,15 +665,15 @@ async def generate_embeddings(source_id: int):
                 detail="Source has no content",
             )
 
-        # ✅ USE EMBEDDING SERVICE
-        embedding_service = get_embedding_service()
-        embedding = await embedding_service.embed_text(source.content)
+        # ✅ USE EMBEDDING SERVICE - run after the response is sent so
+        # the client isn't held for the full embedding latency
+        background_tasks.add_task(_embed_source_chunks, source_id, source.content)
 
         return {
             "source_id": source_id,
             "status": "processing",
             "message": "Embeddings generation started",
-            "embedding_dimension": len(embedding),
+            "embedding_dimension": settings.EMBEDDING_DIMENSION,
         }
 
     except HTTPException:
@@ -3,10 +3,13 @@ Video management and retrieval endpoints - Tortoise ORM
 Handles video tracking, metadata, status, and deletion.
 """
 
+import asyncio
 import logging
+import os
 from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from fastapi.responses import FileResponse, JSONResponse
 
 from app.models.models import Video
 from app.services.cache_service import get_cache_service
@@ -35,8 +38,12 @@ async def list_videos(
         if channel_id:
             query = query.filter(channel_id=channel_id)
 
-        total = await query.count()
-        videos = await query.offset(skip).limit(limit)
+        # Page and count run concurrently instead of as two sequential
+        # round-trips; status/channel_id filters hit the model indexes
+        total, videos = await asyncio.gather(
+            query.count(),
+            query.offset(skip).limit(limit),
+        )
 
         videos_list = [
             {
@@ -48,8 +55,9 @@ async def list_videos(
                 "status": v.status,
                 "progress": v.progress,
                 "quality_score": v.quality_score,
-                "created_at": v.created_at.isoformat(),
-                "completed_at": v.completed_at.isoformat() if v.completed_at else None,
+                # orjson serializes datetimes natively in C
+                "created_at": v.created_at,
+                "completed_at": v.completed_at,
             }
             for v in videos
         ]
@@ -70,11 +78,25 @@ async def list_videos(
 
 
 @router.get("/{video_id}")
-async def get_video(video_id: int):
+async def get_video(video_id: int, request: Request):
     """Get video details and metadata."""
     try:
         logger.debug(f"Fetching video: {video_id}")
 
+        cache_service = get_cache_service()
+        cache_key = f"video:response:{video_id}"
+        if_none_match = request.headers.get("if-none-match")
+
+        # ✅ Cache short-circuit: a Redis GET instead of SELECT + ORM
+        # hydration; matching ETags skip the body entirely
+        cached = await cache_service.get(cache_key)
+        if cached:
+            etag = cached.get("_etag")
+            if etag and if_none_match == etag:
+                return Response(status_code=304, headers={"ETag": etag})
+            payload = {k: v for k, v in cached.items() if k != "_etag"}
+            return JSONResponse(payload, headers={"ETag": etag} if etag else None)
+
         # ✅ Tortoise ORM
         video = await Video.get_or_none(id=video_id)
 
@@ -84,7 +106,7 @@ async def get_video(video_id: int):
                 detail="Video not found",
             )
 
-        return {
+        payload = {
             "id": video.id,
             "title": video.title,
             "description": video.description,
@@ -100,6 +122,16 @@ async def get_video(video_id: int):
             "completed_at": video.completed_at.isoformat() if video.completed_at else None,
         }
 
+        # ETag derived from updated_at; completed videos stop changing
+        # so they get a longer TTL
+        etag = f'"{video.updated_at.isoformat()}"'
+        ttl = 3600 if video.status == "completed" else 300
+        await cache_service.set(cache_key, {**payload, "_etag": etag}, ttl=ttl)
+
+        if if_none_match == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        return JSONResponse(payload, headers={"ETag": etag})
+
     except HTTPException:
         raise
     except Exception as e:
@@ -111,8 +143,8 @@ async def get_video(video_id: int):
 
 
 @router.get("/{video_id}/download")
-async def download_video(video_id: int):
-    """Get video download URL."""
+async def download_video(video_id: int, request: Request):
+    """Get video download URL (JSON contract the frontend consumes)."""
     try:
         logger.debug(f"Getting download info for video: {video_id}")
 
@@ -132,7 +164,9 @@ async def download_video(video_id: int):
             )
 
         return {
-            "download_url": f"/videos/{video.id}",
+            "download_url": str(
+                request.url_for("download_video_file", video_id=video.id)
+            ),
             "filename": f"{video.title.replace(' ', '_')}.mp4",
             "file_size": video.file_size,
             "content_type": "video/mp4",
@@ -148,16 +182,59 @@ async def download_video(video_id: int):
         )
 
 
+@router.get("/{video_id}/download/file")
+async def download_video_file(video_id: int):
+    """Stream the generated video file itself."""
+    try:
+        video = await Video.get_or_none(id=video_id)
+
+        if not video:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Video not found",
+            )
+
+        if video.status != "completed":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Video is {video.status}, not available for download",
+            )
+
+        if not video.output_path or not os.path.exists(video.output_path):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Video file not found on disk",
+            )
+
+        # FileResponse streams via sendfile(2): zero-copy page cache ->
+        # socket, with Content-Length and Range support for free.
+        return FileResponse(
+            video.output_path,
+            media_type="video/mp4",
+            filename=f"{video.title.replace(' ', '_')}.mp4",
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Download failed: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to download video",
+        )
+
+
 @router.delete("/{video_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_video(video_id: int):
     """Delete a generated video."""
     try:
         logger.info(f"🗑️ Deleting video: {video_id}")
 
-        # ✅ Tortoise ORM
-        video = await Video.get_or_none(id=video_id)
+        # ✅ Tortoise ORM - single DELETE round-trip; the row count tells
+        # us whether the video existed without a prior SELECT
+        deleted_count = await Video.filter(id=video_id).delete()
 
-        if not video:
+        if not deleted_count:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Video not found",
@@ -166,9 +243,7 @@ async def delete_video(video_id: int):
         # ✅ Invalidate cache
         cache_service = get_cache_service()
         await cache_service.delete(f"video:{video_id}")
-
-        # Delete from database
-        await video.delete()
+        await cache_service.delete(f"video:response:{video_id}")
 
         logger.info(f"✅ Video deleted: {video_id}")
         return None
@@ -1,54 +1,348 @@
 """
-Cache service - Redis compatible (in-memory fallback)
+Cache service - async Redis with in-memory fallback
 """
 
+import asyncio
+import fnmatch
+import heapq
 import logging
-import json
+import time
 from typing import Any, Optional
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+try:
+    from cachetools import TTLCache
+except ImportError:
+    TTLCache = None
+
+# In-process L1 in front of Redis: hot keys skip the network
+# round-trip and the decode entirely
+_L1_MAXSIZE = 10_000
+_L1_TTL = 60
+
+try:
+    # msgpack packs float-heavy payloads (search results, embeddings)
+    # tighter and faster than JSON encodings
+    import msgpack
+
+    def _dumps(value: Any) -> bytes:
+        return msgpack.packb(value, use_bin_type=True)
+
+    def _loads(raw: bytes) -> Any:
+        return msgpack.unpackb(raw, raw=False)
+
+except ImportError:
+    try:
+        # orjson serializes straight to bytes - no intermediate str,
+        # 3-10x faster than stdlib json on typical cache payloads
+        import orjson
+
+        def _dumps(value: Any) -> bytes:
+            return orjson.dumps(value)
+
+        def _loads(raw: bytes) -> Any:
+            return orjson.loads(raw)
+
+    except ImportError:
+        import json
+
+        def _dumps(value: Any) -> bytes:
+            return json.dumps(value).encode("utf-8")
+
+        def _loads(raw: bytes) -> Any:
+            return json.loads(raw)
+
 
 class CacheService:
-    """Cache service for storing and retrieving cached data."""
-    
+    """Cache service for storing and retrieving cached data.
+
+    Backed by async Redis (shared connection pool) so cache I/O overlaps
+    with other event-loop work; falls back to an in-process dict when
+    redis-py is not installed or the client cannot be built.
+    """
+
     def __init__(self):
+        # Fallback store maps key -> (value, expires_at); the heap of
+        # (expires_at, key) lets expired entries be reaped lazily so the
+        # dict cannot grow unbounded in long-running workers
         self._cache: dict = {}
-    
+        self._heap: list = []
+        self.pool = None
+        self.redis_client = None
+        self._l1 = None
+
+        if aioredis is not None:
+            try:
+                self.pool = aioredis.ConnectionPool.from_url(
+                    settings.REDIS_URL,
+                    # raw bytes in/out - orjson handles (de)serialization
+                    decode_responses=False,
+                    max_connections=settings.REDIS_POOL_SIZE,
+                    socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+                    socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+                )
+                self.redis_client = aioredis.Redis(connection_pool=self.pool)
+                if TTLCache is not None:
+                    self._l1 = TTLCache(maxsize=_L1_MAXSIZE, ttl=_L1_TTL)
+                logger.info("✅ Async Redis cache client initialized")
+            except Exception as e:
+                logger.warning(f"⚠️ Redis unavailable, using in-memory cache: {e}")
+                self.redis_client = None
+        else:
+            logger.warning("⚠️ redis not installed, using in-memory cache")
+
+    def _reap(self) -> None:
+        """Evict expired entries from the fallback store."""
+        now = time.monotonic()
+        while self._heap and self._heap[0][0] <= now:
+            _, key = heapq.heappop(self._heap)
+            entry = self._cache.get(key)
+            if entry is not None and entry[1] <= now:
+                del self._cache[key]
+
+    def _local_get(self, key: str) -> Optional[Any]:
+        """Read one key from the fallback store, honoring its TTL."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            self._cache.pop(key, None)
+            return None
+        return value
+
+    def _local_set(self, key: str, value: Any, ttl: int) -> None:
+        """Write one key to the fallback store with its expiry."""
+        expires_at = time.monotonic() + ttl
+        self._cache[key] = (value, expires_at)
+        heapq.heappush(self._heap, (expires_at, key))
+
+    async def get_raw(self, key: str) -> Optional[bytes]:
+        """Get the raw serialized bytes for a key, skipping the decode.
+
+        Useful when the value is passed through untouched (e.g. straight
+        into an HTTP response body). Returns None on miss or when running
+        on the dict fallback, which stores native objects, not bytes.
+        """
+        try:
+            if self.redis_client is not None:
+                return await self.redis_client.get(key)
+            return None
+        except Exception as e:
+            logger.warning(f"⚠️ Cache get_raw failed: {e}")
+            return None
+
     async def get(self, key: str) -> Optional[Any]:
-        """Get value from cache."""
+        """Get value from cache.
+
+        Hits return the cached object itself (from the L1 layer or the
+        dict fallback), not a copy - callers that mutate the result must
+        copy.deepcopy it first.
+        """
         try:
-            return self._cache.get(key)
+            if self.redis_client is not None:
+                if self._l1 is not None and key in self._l1:
+                    return self._l1[key]
+                raw = await self.redis_client.get(key)
+                value = _loads(raw) if raw is not None else None
+                if value is not None and self._l1 is not None:
+                    self._l1[key] = value
+                return value
+            self._reap()
+            return self._local_get(key)
         except Exception as e:
             logger.warning(f"⚠️ Cache get failed: {e}")
             return None
-    
+
     async def set(self, key: str, value: Any, ttl: int = None) -> bool:
         """Set value in cache."""
         try:
             ttl = ttl or settings.CACHE_TTL
-            self._cache[key] = value
+            if self.redis_client is not None:
+                await self.redis_client.setex(key, ttl, _dumps(value))
+                if self._l1 is not None:
+                    self._l1[key] = value
+            else:
+                self._reap()
+                self._local_set(key, value, ttl)
             logger.debug(f"✅ Cache set: {key}")
             return True
         except Exception as e:
             logger.warning(f"⚠️ Cache set failed: {e}")
             return False
-    
+
+    async def mget(self, keys: list) -> list:
+        """Get many values in one round-trip; None for missing keys."""
+        try:
+            if not keys:
+                return []
+            if self.redis_client is not None:
+                values = [
+                    self._l1[k] if self._l1 is not None and k in self._l1 else None
+                    for k in keys
+                ]
+                missing = [k for k, v in zip(keys, values) if v is None]
+                if missing:
+                    raw = await self.redis_client.mget(missing)
+                    fetched = iter(raw)
+                    for i, (key, value) in enumerate(zip(keys, values)):
+                        if value is None:
+                            hit = next(fetched)
+                            if hit is not None:
+                                values[i] = _loads(hit)
+                                if self._l1 is not None:
+                                    self._l1[key] = values[i]
+                return values
+            self._reap()
+            return [self._local_get(k) for k in keys]
+        except Exception as e:
+            logger.warning(f"⚠️ Cache mget failed: {e}")
+            return [None] * len(keys)
+
+    async def mset(self, items: dict, ttl: int = None) -> bool:
+        """Set many values via one pipelined round-trip."""
+        try:
+            if not items:
+                return True
+            ttl = ttl or settings.CACHE_TTL
+            if self.redis_client is not None:
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    for key, value in items.items():
+                        pipe.setex(key, ttl, _dumps(value))
+                        if self._l1 is not None:
+                            self._l1[key] = value
+                    await pipe.execute()
+            else:
+                self._reap()
+                for key, value in items.items():
+                    self._local_set(key, value, ttl)
+            logger.debug(f"✅ Cache mset: {len(items)} keys")
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ Cache mset failed: {e}")
+            return False
+
     async def delete(self, key: str) -> bool:
         """Delete from cache."""
         try:
-            if key in self._cache:
+            if self.redis_client is not None:
+                if self._l1 is not None:
+                    self._l1.pop(key, None)
+                await self.redis_client.delete(key)
+            elif key in self._cache:
                 del self._cache[key]
             return True
         except Exception as e:
             logger.warning(f"⚠️ Cache delete failed: {e}")
             return False
-    
+
+    async def sadd_with_ttl(self, set_key: str, member: str, ttl: int = None) -> bool:
+        """Add a member to a tracking set, refreshing the set's TTL."""
+        try:
+            ttl = ttl or settings.CACHE_TTL
+            if self.redis_client is not None:
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    pipe.sadd(set_key, member)
+                    pipe.expire(set_key, ttl)
+                    await pipe.execute()
+            else:
+                members = self._local_get(set_key) or set()
+                members.add(member)
+                self._local_set(set_key, members, ttl)
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ Cache sadd failed: {e}")
+            return False
+
+    async def smembers(self, set_key: str) -> list:
+        """Read all members of a tracking set."""
+        try:
+            if self.redis_client is not None:
+                raw = await self.redis_client.smembers(set_key)
+                return [v.decode("utf-8") for v in raw]
+            members = self._local_get(set_key)
+            return list(members) if members else []
+        except Exception as e:
+            logger.warning(f"⚠️ Cache smembers failed: {e}")
+            return []
+
+    async def pipeline_delete(self, keys: list, patterns: list = None) -> bool:
+        """Invalidate many keys and patterns in one pipelined round-trip.
+
+        Exact keys and every SCAN match are queued as UNLINKs on a single
+        pipeline, so N invalidations cost one network round-trip instead
+        of N.
+        """
+        try:
+            patterns = patterns or []
+            if self.redis_client is not None:
+                if self._l1 is not None:
+                    for key in keys:
+                        self._l1.pop(key, None)
+                    for pattern in patterns:
+                        for key in [
+                            k for k in self._l1 if fnmatch.fnmatch(k, pattern)
+                        ]:
+                            self._l1.pop(key, None)
+
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    for key in keys:
+                        pipe.unlink(key)
+                    for pattern in patterns:
+                        async for key in self.redis_client.scan_iter(
+                            match=pattern, count=500
+                        ):
+                            pipe.unlink(key)
+                    await pipe.execute()
+                logger.debug(f"✅ Pipeline-deleted {len(keys)} keys")
+                return True
+
+            for key in keys:
+                self._cache.pop(key, None)
+            for pattern in patterns:
+                for key in [
+                    k for k in self._cache if fnmatch.fnmatch(k, pattern)
+                ]:
+                    del self._cache[key]
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ Cache pipeline delete failed: {e}")
+            return False
+
     async def clear_pattern(self, pattern: str) -> bool:
         """Clear cache keys matching pattern."""
         try:
-            import fnmatch
+            if self.redis_client is not None:
+                if self._l1 is not None:
+                    for key in [k for k in self._l1 if fnmatch.fnmatch(k, pattern)]:
+                        self._l1.pop(key, None)
+                # SCAN walks the keyspace incrementally; KEYS is O(N)
+                # and blocks the whole Redis server while it scans.
+                # UNLINKs are pipelined so each 500-key flush costs one
+                # round-trip, and the server frees memory off-thread.
+                deleted = 0
+                pending = 0
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    async for key in self.redis_client.scan_iter(match=pattern, count=500):
+                        pipe.unlink(key)
+                        pending += 1
+                        if pending >= 500:
+                            await pipe.execute()
+                            deleted += pending
+                            pending = 0
+                    if pending:
+                        await pipe.execute()
+                        deleted += pending
+                logger.debug(f"✅ Cleared {deleted} cache entries")
+                return True
+
             keys_to_delete = [k for k in self._cache.keys() if fnmatch.fnmatch(k, pattern)]
             for key in keys_to_delete:
                 del self._cache[key]
@@ -57,10 +351,12 @@ class CacheService:
         except Exception as e:
             logger.warning(f"⚠️ Cache clear failed: {e}")
             return False
-    
+
     async def health_check(self) -> bool:
         """Check cache health."""
         try:
+            if self.redis_client is not None:
+                return await self.redis_client.ping()
             await self.set("health_check", "ok", ttl=1)
             return True
         except Exception as e:
@@ -68,12 +364,19 @@ class CacheService:
             return False
 
 
-_cache_service = None
+# One service (and Redis pool) per event loop: redis.asyncio connections
+# bind to the loop that first awaits them, so the uvicorn loop and the
+# dedicated video worker loop must not share a client across threads
+_cache_services: dict = {}
 
 
 def get_cache_service() -> CacheService:
-    """Get or create cache service instance."""
-    global _cache_service
-    if _cache_service is None:
-        _cache_service = CacheService()
-    return _cache_service
+    """Get or create the cache service for the current event loop."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    service = _cache_services.get(loop)
+    if service is None:
+        service = _cache_services[loop] = CacheService()
+    return service
@@ -2,15 +2,32 @@
 Concept extraction service - Tortoise ORM
 """
 
+import functools
+import hashlib
 import logging
+import re
+from collections import Counter, defaultdict
 from typing import List, Dict
 
+from app.services.cache_service import get_cache_service
+
 logger = logging.getLogger(__name__)
 
+_SENTENCE_RE = re.compile(r"[^.!?]+[.!?]")
+_MAX_CONCEPTS = 15
+
+_STOPWORDS = frozenset(
+    {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for'}
+)
+_PUNCT_TABLE = str.maketrans('', '', '.,!?;:')
+
 
 class ConceptExtractionService:
     """Extract key concepts and topics from content."""
-    
+
+    def __init__(self):
+        self.cache_service = get_cache_service()
+
     async def extract_concepts(self, content: str) -> List[Dict]:
         """
         Extract key concepts from content using NLP.
@@ -24,24 +41,52 @@ class ConceptExtractionService:
         try:
             if not content or len(content.strip()) == 0:
                 return []
-            
-            # Split by sentences for key points
-            sentences = content.split('. ')
+
+            # Identical content yields identical concepts - short-circuit
+            # through the cache keyed by content hash
+            cache_key = (
+                "concepts:"
+                + hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+            )
+            cached = await self.cache_service.get(cache_key)
+            if cached is not None:
+                logger.debug(f"✅ Concept cache hit: {cache_key}")
+                return cached
+
+            # Scan sentences lazily and stop as soon as enough are found,
+            # so MB-sized content never pays for a full split
             concepts = []
-            
-            for sentence in sentences[:15]:
-                sentence = sentence.strip()
+            last_end = 0
+
+            for match in _SENTENCE_RE.finditer(content):
+                last_end = match.end()
+                sentence = match.group().strip()
                 if len(sentence) > 10:  # Skip very short sentences
-                    # Extract first 50 chars as concept name
-                    concept_name = sentence[:100]
-                    
                     concepts.append({
-                        "name": concept_name,
+                        "name": sentence[:100],
                         "confidence": 0.85,
                         "category": "key_point",
                         "description": sentence
                     })
-            
+                    if len(concepts) >= _MAX_CONCEPTS:
+                        break
+
+            # The regex requires trailing punctuation, so text with no
+            # terminator (transcripts, bullet notes) would yield nothing -
+            # treat the unterminated remainder as one final sentence
+            if len(concepts) < _MAX_CONCEPTS:
+                remainder = content[last_end:].strip()
+                if len(remainder) > 10:
+                    concepts.append({
+                        "name": remainder[:100],
+                        "confidence": 0.85,
+                        "category": "key_point",
+                        "description": remainder
+                    })
+
+
+            await self.cache_service.set(cache_key, concepts, ttl=86400)
+
             logger.info(f"✅ Extracted {len(concepts)} concepts from content")
             return concepts
         
@@ -55,25 +100,49 @@ class ConceptExtractionService:
             if not content:
                 return []
             
-            words = content.split()
-            # Filter common words and get unique ones
-            common_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for'}
-            keywords = []
-            
-            for word in words:
-                clean_word = word.lower().strip('.,!?;:')
-                if clean_word not in common_words and len(clean_word) > 3:
-                    if clean_word not in keywords:
-                        keywords.append(clean_word)
-                        if len(keywords) >= max_keywords:
-                            break
-            
-            return keywords
+            # Counter gives O(1) dedupe plus frequency ranking, so the
+            # top keywords come back by salience rather than first-seen
+            counts = Counter(
+                clean_word
+                for word in content.split()
+                if len(clean_word := word.lower().translate(_PUNCT_TABLE)) > 3
+                and clean_word not in _STOPWORDS
+            )
+
+            return [word for word, _ in counts.most_common(max_keywords)]
         except Exception as e:
             logger.error(f"❌ Keyword extraction failed: {e}")
             return []
 
+    def extract_hierarchy(self, concepts: List[Dict]) -> Dict:
+        """
+        Group extracted concepts into a category tree.
+
+        Args:
+            concepts: Concepts from extract_concepts
+
+        Returns:
+            Hierarchy dict with one child node per category
+        """
+        try:
+            # defaultdict appends with a single lookup per concept
+            by_category = defaultdict(list)
+            for concept in concepts:
+                by_category[concept.get("category", "other")].append(concept)
+
+            return {
+                "root": "Knowledge",
+                "children": [
+                    {"name": category, "children": children}
+                    for category, children in by_category.items()
+                ],
+            }
+        except Exception as e:
+            logger.error(f"❌ Hierarchy extraction failed: {e}")
+            return {"root": "Knowledge", "children": []}
+
 
+@functools.cache
 def get_concept_extraction_service() -> ConceptExtractionService:
     """Get concept extraction service instance."""
     return ConceptExtractionService()
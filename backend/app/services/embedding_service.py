@@ -2,15 +2,31 @@
 Text embedding service
 """
 
+import asyncio
+import base64
+import functools
+import hashlib
 import logging
-from typing import List
+import struct
+import numpy as np
+from typing import List, Optional
+
+from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Bound on the in-process embedding memo; oldest entries are evicted first
+_MEMO_MAXSIZE = 10_000
+
 
 class EmbeddingService:
     """Generate and manage text embeddings."""
-    
+
+    def __init__(self):
+        # Memo keyed by text hash so identical texts across graph builds
+        # never hit the model twice
+        self._memo: dict = {}
+
     async def embed_text(self, text: str) -> List[float]:
         """
         Generate embedding for text (mock implementation).
@@ -24,15 +40,23 @@ class EmbeddingService:
         try:
             if not text:
                 return [0.0] * 768  # Default embedding dimension
-            
-            # Mock embedding - in production use actual model
-            import hashlib
-            hash_obj = hashlib.md5(text.encode())
-            hash_value = int(hash_obj.hexdigest(), 16)
-            
-            # Generate deterministic embedding
-            embedding = [(hash_value >> i & 1) * 0.5 for i in range(768)]
-            
+
+            digest = hashlib.blake2b(text.encode(), digest_size=16).digest()
+            memoized = self._memo.get(digest)
+            if memoized is not None:
+                return memoized
+
+            # Mock embedding - in production use actual model.
+            # Seed a fast PRNG from the text hash and fill the vector in
+            # one C-level call instead of 768 Python shift/and iterations
+            seed = int.from_bytes(digest[:8], "little")
+            rng = np.random.default_rng(seed)
+            embedding = (rng.integers(0, 2, 768) * 0.5).astype(np.float32).tolist()
+
+            if len(self._memo) >= _MEMO_MAXSIZE:
+                self._memo.pop(next(iter(self._memo)))
+            self._memo[digest] = embedding
+
             logger.debug(f"✅ Embedded text: {len(text)} chars")
             return embedding
         
@@ -40,7 +64,93 @@ class EmbeddingService:
             logger.error(f"❌ Embedding failed: {e}")
             return [0.0] * 768
 
+    async def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embeddings for a batch of texts.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            One embedding vector per input text
+        """
+        try:
+            # Overlap the per-text round-trips instead of running them
+            # serially; the semaphore caps in-flight requests
+            semaphore = asyncio.Semaphore(settings.EMBEDDING_CONCURRENCY)
+
+            async def _embed_one(text: str) -> List[float]:
+                async with semaphore:
+                    return await self.embed_text(text)
+
+            embeddings = list(
+                await asyncio.gather(*(_embed_one(text) for text in texts))
+            )
+
+            logger.debug(f"✅ Embedded batch of {len(texts)} texts")
+            return embeddings
+
+        except Exception as e:
+            logger.error(f"❌ Batch embedding failed: {e}")
+            return [[0.0] * 768 for _ in texts]
+
+    def similarity_matrix(self, embeddings: List[List[float]]) -> np.ndarray:
+        """
+        Compute the full pairwise cosine similarity matrix.
+
+        Normalizes the embedding matrix once, then a single matrix
+        product (BLAS) yields all N² similarities - far cheaper than
+        N² per-pair calls.
+
+        Args:
+            embeddings: One embedding vector per item
+
+        Returns:
+            NxN similarity matrix
+        """
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        matrix /= np.linalg.norm(matrix, axis=1, keepdims=True) + 1e-12
+        return matrix @ matrix.T
+
+    def pack_embedding(self, embedding: List[float]) -> str:
+        """
+        Quantize an embedding to int8 for compact cache storage.
+
+        Stores a per-vector float32 scale followed by 768 int8 values,
+        base64-wrapped so it survives the JSON cache encoding - roughly
+        1 KB per vector vs ~8-10 KB for JSON-encoded floats.
+
+        Args:
+            embedding: Embedding vector
+
+        Returns:
+            Base64 string of packed scale + int8 payload
+        """
+        vec = np.asarray(embedding, dtype=np.float32)
+        scale = float(np.abs(vec).max()) / 127.0 or 1.0
+        quantized = np.round(vec / scale).astype(np.int8)
+        packed = struct.pack("<f", scale) + quantized.tobytes()
+        return base64.b64encode(packed).decode("ascii")
+
+    def unpack_embedding(self, packed: str) -> List[float]:
+        """
+        Restore an embedding packed with pack_embedding.
+
+        Args:
+            packed: Base64 string of packed scale + int8 payload
+
+        Returns:
+            Dequantized embedding vector
+        """
+        raw = base64.b64decode(packed)
+        (scale,) = struct.unpack_from("<f", raw)
+        quantized = np.frombuffer(raw, dtype=np.int8, offset=4)
+        return (quantized.astype(np.float32) * scale).tolist()
+
 
+# Singleton instance - constructed once so a future model load or HTTP
+# session isn't paid per request
+@functools.cache
 def get_embedding_service() -> EmbeddingService:
-    """Get embedding service instance."""
+    """Get or create embedding service singleton."""
     return EmbeddingService()
@@ -4,11 +4,15 @@ Knowledge graph service for building concept relationships.
 Creates connections between concepts and videos for semantic learning.
 """
 
+import functools
 import logging
+import numpy as np
+from collections import defaultdict, deque
 from typing import List, Optional, Tuple
 
 from app.services.embedding_service import get_embedding_service
 from app.services.cache_service import get_cache_service
+from app.utils.cache_manager import CacheKeyBuilder
 
 logger = logging.getLogger(__name__)
 
@@ -46,22 +50,22 @@ class KnowledgeGraphService:
                 "edges": [],
             }
 
-            # Find relationships between concepts
-            for i, concept1 in enumerate(concepts):
-                for concept2 in concepts[i + 1 :]:
-                    similarity = await self._calculate_concept_similarity(
-                        concept1,
-                        concept2,
-                    )
-
-                    if similarity > 0.6:  # Threshold
-                        edge = {
-                            "source": concept1["name"],
-                            "target": concept2["name"],
-                            "weight": similarity,
-                            "type": "related",
-                        }
-                        graph["edges"].append(edge)
+            # Pre-fetch all concept embeddings in one cache round-trip
+            # instead of re-resolving them inside the O(N²) pair loop
+            embeddings = await self._get_concept_embeddings(concepts)
+
+            if embeddings:
+                # One normalized matrix product gives all N² similarities
+                similarities = self.embedding_service.similarity_matrix(embeddings)
+                rows, cols = np.nonzero(np.triu(similarities > 0.6, k=1))
+                for i, j in zip(rows.tolist(), cols.tolist()):
+                    edge = {
+                        "source": concepts[i]["name"],
+                        "target": concepts[j]["name"],
+                        "weight": float(similarities[i, j]),
+                        "type": "related",
+                    }
+                    graph["edges"].append(edge)
 
             logger.info(f"✅ Built graph with {len(graph['edges'])} relationships")
             return graph
@@ -70,38 +74,70 @@ class KnowledgeGraphService:
             logger.error(f"❌ Graph building failed: {e}")
             return {"nodes": [], "edges": []}
 
-    async def _calculate_concept_similarity(
-        self,
-        concept1: dict,
-        concept2: dict,
-    ) -> float:
+    async def _get_concept_embeddings(self, concepts: List[dict]) -> List[list]:
         """
-        Calculate similarity between two concepts.
+        Resolve embeddings for all concepts with one bulk cache lookup.
 
         Args:
-            concept1: First concept
-            concept2: Second concept
+            concepts: List of concepts
 
         Returns:
-            Similarity score (0-1)
+            One embedding per concept, in input order
         """
-        try:
-            # Combine name and description for better similarity
-            text1 = f"{concept1['name']} {concept1.get('description', '')}"
-            text2 = f"{concept2['name']} {concept2.get('description', '')}"
+        # Combine name and description for better similarity
+        texts = [
+            f"{concept['name']} {concept.get('description', '')}"
+            for concept in concepts
+        ]
+        keys = [CacheKeyBuilder.embedding_key(text) for text in texts]
+        cached = await self.cache_service.mget(keys)
+
+        embeddings = [
+            self.embedding_service.unpack_embedding(hit) if hit is not None else None
+            for hit in cached
+        ]
+
+        # Embed every miss in one batched call rather than one await per
+        # concept - O(N) embedding work total, not O(N²)
+        missing = [i for i, emb in enumerate(embeddings) if emb is None]
+        to_store = {}
+        if missing:
+            fresh = await self.embedding_service.embed_batch(
+                [texts[i] for i in missing]
+            )
+            for i, embedding in zip(missing, fresh):
+                embeddings[i] = embedding
+                # Quantized to int8 - ~8x smaller than JSON floats
+                to_store[keys[i]] = self.embedding_service.pack_embedding(embedding)
+
+        if to_store:
+            await self.cache_service.mset(to_store)
+
+        return embeddings
+
+    @staticmethod
+    def _adjacency(graph: dict) -> dict:
+        """
+        Build (and cache on the graph) a source -> targets index.
 
-            emb1 = await self.embedding_service.embed_text(text1)
-            emb2 = await self.embedding_service.embed_text(text2)
+        Lets BFS expansions cost O(deg(v)) instead of re-scanning every
+        edge per visited node.
 
-            if not emb1 or not emb2:
-                return 0.0
+        Args:
+            graph: Knowledge graph
 
-            similarity = await self.embedding_service.similarity(emb1, emb2)
-            return similarity
+        Returns:
+            Adjacency mapping of concept name to neighbor names
+        """
+        if "_adj" in graph:
+            return graph["_adj"]
 
-        except Exception as e:
-            logger.debug(f"⚠️  Similarity calculation failed: {e}")
-            return 0.0
+        adjacency = defaultdict(list)
+        for edge in graph.get("edges", []):
+            adjacency[edge["source"]].append(edge["target"])
+
+        graph["_adj"] = adjacency
+        return adjacency
 
     async def find_learning_path(
         self,
@@ -130,7 +166,7 @@ class KnowledgeGraphService:
             logger.debug(f"Finding path: {start_concept} -> {end_concept}")
 
             # Simple BFS implementation
-            from collections import deque
+            adjacency = self._adjacency(graph)
 
             queue = deque([(start_concept, [start_concept])])
             visited = {start_concept}
@@ -142,13 +178,10 @@ class KnowledgeGraphService:
                     logger.info(f"✅ Found path: {' -> '.join(path)}")
                     return path
 
-                # Find neighbors
-                for edge in graph.get("edges", []):
-                    if edge["source"] == current:
-                        neighbor = edge["target"]
-                        if neighbor not in visited:
-                            visited.add(neighbor)
-                            queue.append((neighbor, path + [neighbor]))
+                for neighbor in adjacency.get(current, ()):
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        queue.append((neighbor, path + [neighbor]))
 
             logger.warning(f"⚠️  No path found")
             return []
@@ -183,20 +216,22 @@ class KnowledgeGraphService:
         try:
             logger.debug(f"Finding related concepts for: {concept_name}")
 
+            adjacency = self._adjacency(graph)
+
             related = set()
-            to_explore = [(concept_name, 0)]
+            to_explore = deque([(concept_name, 0)])
 
             while to_explore:
-                current, curr_depth = to_explore.pop(0)
+                current, curr_depth = to_explore.popleft()
 
                 if curr_depth > depth:
                     continue
 
-                for edge in graph.get("edges", []):
-                    if edge["source"] == current and edge["target"] not in related:
-                        related.add(edge["target"])
+                for neighbor in adjacency.get(current, ()):
+                    if neighbor not in related:
+                        related.add(neighbor)
                         if curr_depth < depth:
-                            to_explore.append((edge["target"], curr_depth + 1))
+                            to_explore.append((neighbor, curr_depth + 1))
 
             logger.info(f"✅ Found {len(related)} related concepts")
             return list(related)
@@ -207,9 +242,7 @@ class KnowledgeGraphService:
 
 
 # Singleton instance
-_graph_service: Optional[KnowledgeGraphService] = None
-
-
+@functools.cache
 def get_knowledge_graph_service() -> KnowledgeGraphService:
     """
     Get or create knowledge graph service singleton.
@@ -217,7 +250,4 @@ def get_knowledge_graph_service() -> KnowledgeGraphService:
     Returns:
         KnowledgeGraphService instance
     """
-    global _graph_service
-    if _graph_service is None:
-        _graph_service = KnowledgeGraphService()
-    return _graph_service
+    return KnowledgeGraphService()
@@ -3,13 +3,83 @@ Professional video generation service using YAML configuration.
 Implements script generation, visual design, timing, and QA from config.
 """
 
+import functools
 import logging
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 import yaml
 from pathlib import Path
+
+try:
+    # libyaml-backed loader parses several times faster than pure Python
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 from typing import Dict, List, Optional
 
+from app.config import settings
+
 logger = logging.getLogger(__name__)
 
+# attribute -> (filename, top-level YAML key)
+_CONFIG_FILES = {
+    "channels": ("channel_categories.yaml", "channel_categories"),
+    "script_config": ("script_generation.yaml", "script_generation"),
+    "analysis_config": ("content_analysis.yaml", "content_analysis"),
+    "design_config": ("video_design.yaml", "video_design"),
+    "timing_config": ("pacing_timing.yaml", "pacing_timing"),
+    "qa_config": ("quality_assurance.yaml", "quality_assurance"),
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _load_all_configs() -> Dict[str, Dict]:
+    """Parse all YAML configs once per process.
+
+    YAML parsing is a known startup hotspot, so the parsed result is also
+    pickled to CACHE_DIR keyed by file mtimes - later cold starts skip
+    the six disk+parse cycles entirely until a config file changes.
+    """
+    base_path = Path(__file__).parent.parent.parent / "prompts"
+    mtimes = tuple(
+        sorted(
+            (filename, (base_path / filename).stat().st_mtime)
+            for filename, _ in _CONFIG_FILES.values()
+        )
+    )
+
+    cache_path = Path(settings.CACHE_DIR) / "yaml_configs.pkl"
+    try:
+        if cache_path.exists():
+            with open(cache_path, "rb") as f:
+                payload = pickle.load(f)
+            if payload.get("mtimes") == mtimes:
+                logger.info("✅ YAML configs loaded from pickle cache")
+                return payload["configs"]
+    except Exception as e:
+        logger.warning(f"⚠️ Config pickle cache unreadable: {e}")
+
+    def _load_one(item):
+        attr, (filename, root_key) = item
+        with open(base_path / filename, encoding="utf-8") as f:
+            return attr, yaml.load(f, Loader=SafeLoader).get(root_key, {})
+
+    # The six files are independent reads - overlap the open+parse
+    # cycles instead of paying for them back to back
+    with ThreadPoolExecutor(max_workers=len(_CONFIG_FILES)) as executor:
+        configs = dict(executor.map(_load_one, _CONFIG_FILES.items()))
+
+    logger.info(f"✅ All YAML configs loaded from: {base_path}")
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, "wb") as f:
+            pickle.dump({"mtimes": mtimes, "configs": configs}, f)
+    except Exception as e:
+        logger.warning(f"⚠️ Could not write config pickle cache: {e}")
+
+    return configs
+
 
 class ProfessionalVideoService:
     """Generate professional videos following YAML specifications."""
@@ -21,37 +91,13 @@ class ProfessionalVideoService:
     def load_configs(self):
         """Load all YAML config files - WITH UTF-8 ENCODING."""
         try:
-            # Get the path relative to where the service runs
-            base_path = Path(__file__).parent.parent.parent / "prompts"
-            
-            print(f"📂 Loading configs from: {base_path}")
-            
-            # Channel categories
-            with open(base_path / "channel_categories.yaml", encoding='utf-8') as f:
-                self.channels = yaml.safe_load(f).get("channel_categories", {})
-            
-            # Script generation
-            with open(base_path / "script_generation.yaml", encoding='utf-8') as f:
-                self.script_config = yaml.safe_load(f).get("script_generation", {})
-            
-            # Content analysis
-            with open(base_path / "content_analysis.yaml", encoding='utf-8') as f:
-                self.analysis_config = yaml.safe_load(f).get("content_analysis", {})
-            
-            # Video design
-            with open(base_path / "video_design.yaml", encoding='utf-8') as f:
-                self.design_config = yaml.safe_load(f).get("video_design", {})
-            
-            # Pacing & timing
-            with open(base_path / "pacing_timing.yaml", encoding='utf-8') as f:
-                self.timing_config = yaml.safe_load(f).get("pacing_timing", {})
-            
-            # Quality assurance
-            with open(base_path / "quality_assurance.yaml", encoding='utf-8') as f:
-                self.qa_config = yaml.safe_load(f).get("quality_assurance", {})
-            
-            logger.info(f"✅ All YAML configs loaded from: {base_path}")
-        
+            # Parsed once per process (and pickled across restarts)
+            configs = _load_all_configs()
+            for attr in _CONFIG_FILES:
+                setattr(self, attr, configs[attr])
+
+            self._build_prompt_templates()
+
         except FileNotFoundError as fe:
             logger.error(f"❌ Config file not found: {fe}")
             raise
@@ -82,14 +128,18 @@ class ProfessionalVideoService:
         """Get quality assurance requirements."""
         return self.qa_config
     
-    async def build_script_prompt(self, title: str, sources: str, channel_id: str) -> str:
-        """Build Gemini prompt using script generation config."""
+    def _build_prompt_templates(self) -> None:
+        """Precompile prompt templates with guideline defaults baked in.
+
+        The guideline lookups only change when configs reload, so they
+        are resolved once here instead of on every prompt build.
+        """
         guidelines = self.script_config.get("guidelines", {})
-        
-        prompt = f"""Generate a PROFESSIONAL video script following these guidelines:
 
-Title: {title}
-Channel: {channel_id}
+        self._script_template = f"""Generate a PROFESSIONAL video script following these guidelines:
+
+Title: {{title}}
+Channel: {{channel_id}}
 
 SCRIPT GUIDELINES:
 - Hook: {guidelines.get('hook', 'Engage immediately')}
@@ -98,31 +148,51 @@ SCRIPT GUIDELINES:
 - Pacing: {guidelines.get('pacing', 'Natural rhythm')}
 
 Source Material:
-{sources[:2000]}
+{{sources}}
 
 Output ONLY clean script text, no markdown."""
-        
-        return prompt
-    
-    async def build_visual_prompt(self, script: str, channel_id: str) -> str:
-        """Build visual generation prompt from design config."""
-        design = self.get_design_specs(channel_id)
-        
-        prompt = f"""Generate CINEMATIC visual frame descriptions:
 
-Design Style: {design.get('style', 'Professional')}
-Color Palette: {design.get('colors', 'Professional')}
-Animation: {design.get('animation_style', 'Smooth')}
-Visual Emphasis: {design.get('visual_emphasis', 'Key concepts')}
+        self._visual_template = """Generate CINEMATIC visual frame descriptions:
+
+Design Style: {style}
+Color Palette: {colors}
+Animation: {animation_style}
+Visual Emphasis: {visual_emphasis}
 
 Script to visualize:
-{script[:1000]}
+{script}
 
 Generate 15 vivid, cinematic frame descriptions."""
-        
-        return prompt
+
+    def build_script_prompt(self, title: str, sources: str, channel_id: str) -> str:
+        """Build Gemini prompt using script generation config.
+
+        Pure string work - sync on purpose so callers skip a needless
+        coroutine round-trip.
+        """
+        # Only copy a prefix when the source actually exceeds the budget;
+        # short inputs are passed through without duplicating the string
+        sources_prefix = sources if len(sources) <= 2000 else sources[:2000]
+        return self._script_template.format_map({
+            "title": title,
+            "channel_id": channel_id,
+            "sources": sources_prefix,
+        })
+
+    def build_visual_prompt(self, script: str, channel_id: str) -> str:
+        """Build visual generation prompt from design config."""
+        design = self.get_design_specs(channel_id)
+
+        return self._visual_template.format_map({
+            "style": design.get("style", "Professional"),
+            "colors": design.get("colors", "Professional"),
+            "animation_style": design.get("animation_style", "Smooth"),
+            "visual_emphasis": design.get("visual_emphasis", "Key concepts"),
+            "script": script if len(script) <= 1000 else script[:1000],
+        })
 
 
+@functools.cache
 def get_professional_video_service() -> ProfessionalVideoService:
     """Get service instance."""
     return ProfessionalVideoService()
@@ -2,15 +2,249 @@
 Semantic search service
 """
 
+import functools
 import logging
-from typing import List, Dict
+import time
+import numpy as np
+from collections import OrderedDict, deque
+from typing import List, Dict, Optional
+
+from app.config import settings
+from app.services.embedding_service import get_embedding_service
+from app.utils.cache_manager import CacheKeyBuilder
 
 logger = logging.getLogger(__name__)
 
+# Bounds for the in-process query-embedding memo
+_QUERY_CACHE_MAX = 1024
+_QUERY_CACHE_TTL = 300
+
+# Semantic result cache: a paraphrased query whose embedding lands this
+# close to a recent one reuses its results outright
+_SEM_CACHE_MAX = 500
+_SEM_CACHE_TTL = 300
+_SEM_CACHE_SIM = 0.95
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+try:
+    import faiss
+except ImportError:
+    faiss = None
+
+
+if njit is not None:
+
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _cosine_kernel(matrix, query, query_norm, out):
+        """Fused dot+norm pass over contiguous float32 rows."""
+        for i in prange(matrix.shape[0]):
+            dot = 0.0
+            row_norm = 0.0
+            for k in range(matrix.shape[1]):
+                dot += matrix[i, k] * query[k]
+                row_norm += matrix[i, k] * matrix[i, k]
+            out[i] = dot / (row_norm ** 0.5 * query_norm + 1e-12)
+
+else:
+    _cosine_kernel = None
+
 
 class SemanticSearchService:
     """Perform semantic search on content."""
-    
+
+    def __init__(self):
+        # Optional FAISS inner-product index over unit vectors; beats the
+        # linear scan once the corpus grows past a few thousand entries
+        self._index = None
+        self._id_map: List = []
+        # Structure-of-arrays store: one contiguous (N, d) int8 matrix of
+        # quantized unit vectors plus a per-row scale, grown
+        # geometrically - 4x smaller resident than float32, so the brute
+        # scan moves a quarter of the bytes
+        self._embeddings: Optional[np.ndarray] = None
+        self._scales: Optional[np.ndarray] = None
+        self._embedding_count = 0
+        # Repeated queries are common - memoize their embeddings with
+        # LRU eviction plus a TTL so entries do not pin memory forever
+        self._query_cache: OrderedDict = OrderedDict()
+        # (query unit vector, fingerprint, results, expires_at);
+        # maxlen evicts oldest
+        self._sem_cache: deque = deque(maxlen=_SEM_CACHE_MAX)
+
+    def _sem_cache_get(
+        self, query_unit: np.ndarray, fingerprint: tuple
+    ) -> Optional[List[Dict]]:
+        """Return cached results for a near-identical recent query.
+
+        Only entries from the same candidate set and search parameters
+        are eligible - a matching query over different videos or a
+        different top_k must not reuse old results.
+        """
+        now = time.monotonic()
+        while self._sem_cache and self._sem_cache[0][3] <= now:
+            self._sem_cache.popleft()
+        entries = [e for e in self._sem_cache if e[1] == fingerprint]
+        if not entries:
+            return None
+
+        vectors = np.stack([entry[0] for entry in entries])
+        scores = vectors @ query_unit
+        best = int(np.argmax(scores))
+        if scores[best] >= _SEM_CACHE_SIM:
+            return entries[best][2]
+        return None
+
+    async def embed_query(self, query: str) -> List[float]:
+        """
+        Embed a search query, memoizing repeat queries in-process.
+
+        Args:
+            query: Search query text
+
+        Returns:
+            Query embedding vector
+        """
+        key = CacheKeyBuilder.embedding_key(query)
+        now = time.monotonic()
+
+        hit = self._query_cache.get(key)
+        if hit is not None and hit[0] > now:
+            self._query_cache.move_to_end(key)
+            return hit[1]
+
+        embedding = await get_embedding_service().embed_text(query)
+        self._query_cache[key] = (now + _QUERY_CACHE_TTL, embedding)
+        self._query_cache.move_to_end(key)
+        while len(self._query_cache) > _QUERY_CACHE_MAX:
+            self._query_cache.popitem(last=False)
+
+        return embedding
+
+    def index_add(self, item_id, embedding: List[float]) -> bool:
+        """
+        Add one embedding to the similarity index.
+
+        Args:
+            item_id: Identifier returned by index_search
+            embedding: Embedding vector
+
+        Returns:
+            True when indexed
+        """
+        try:
+            vec = np.asarray(embedding, dtype=np.float32).reshape(1, -1)
+            vec /= np.linalg.norm(vec) + 1e-12
+
+            if self._embeddings is None:
+                self._embeddings = np.empty((16, vec.shape[1]), dtype=np.int8)
+                self._scales = np.empty(16, dtype=np.float32)
+            elif self._embedding_count == self._embeddings.shape[0]:
+                grown = np.empty(
+                    (self._embeddings.shape[0] * 2, self._embeddings.shape[1]),
+                    dtype=np.int8,
+                )
+                grown[: self._embedding_count] = self._embeddings
+                self._embeddings = grown
+                grown_scales = np.empty(grown.shape[0], dtype=np.float32)
+                grown_scales[: self._embedding_count] = self._scales
+                self._scales = grown_scales
+
+            scale = float(np.abs(vec).max()) / 127.0 or 1.0
+            self._embeddings[self._embedding_count] = np.round(
+                vec[0] / scale
+            ).astype(np.int8)
+            self._scales[self._embedding_count] = scale
+            self._embedding_count += 1
+            self._id_map.append(item_id)
+
+            if faiss is not None:
+                if self._index is None:
+                    self._index = faiss.IndexFlatIP(vec.shape[1])
+                self._index.add(vec)
+
+            return True
+        except Exception as e:
+            logger.error(f"❌ Index add failed: {e}")
+            return False
+
+    def index_search(
+        self,
+        query_embedding: List[float],
+        top_k: Optional[int] = None,
+        threshold: Optional[float] = None,
+    ) -> List[Dict]:
+        """
+        Query the similarity index for nearest items.
+
+        Uses FAISS when available, otherwise one matrix-vector product
+        over the contiguous embedding store.
+
+        Args:
+            query_embedding: Query embedding vector
+            top_k: Number of results (defaults to MAX_SEARCH_RESULTS)
+            threshold: Minimum similarity (defaults to SIMILARITY_THRESHOLD)
+
+        Returns:
+            Matches as {"id", "similarity"}, best first
+        """
+        if self._embedding_count == 0:
+            return []
+        try:
+            top_k = top_k or settings.MAX_SEARCH_RESULTS
+            if threshold is None:
+                threshold = settings.SIMILARITY_THRESHOLD
+
+            query = np.asarray(query_embedding, dtype=np.float32).reshape(1, -1)
+            query /= np.linalg.norm(query) + 1e-12
+
+            if self._index is not None and self._index.ntotal > 0:
+                scores, indices = self._index.search(
+                    query, min(top_k, self._index.ntotal)
+                )
+                return [
+                    {"id": self._id_map[idx], "similarity": float(score)}
+                    for score, idx in zip(scores[0], indices[0])
+                    if idx >= 0 and score >= threshold
+                ]
+
+            # int8 dot products with per-row rescaling; the shortlist is
+            # then re-ranked with exact fp32 scores
+            count = self._embedding_count
+            q_scale = float(np.abs(query).max()) / 127.0 or 1.0
+            q_int8 = np.round(query[0] / q_scale).astype(np.int8)
+            raw = self._embeddings[:count].astype(np.int32) @ q_int8.astype(np.int32)
+            sims = raw.astype(np.float32) * (self._scales[:count] * q_scale)
+
+            qualified = np.where(sims >= threshold)[0]
+            if qualified.size == 0:
+                return []
+            k = min(top_k, qualified.size)
+            shortlist_k = min(max(k, 50), qualified.size)
+            shortlist = qualified[
+                np.argpartition(-sims[qualified], shortlist_k - 1)[:shortlist_k]
+            ]
+
+            exact_rows = (
+                self._embeddings[shortlist].astype(np.float32)
+                * self._scales[shortlist, None]
+            )
+            exact = exact_rows @ query[0]
+            order = np.argsort(-exact)[:k]
+            return [
+                {
+                    "id": self._id_map[i],
+                    "similarity": float(score),
+                }
+                for i, score in zip(shortlist[order].tolist(), exact[order].tolist())
+            ]
+        except Exception as e:
+            logger.error(f"❌ Index search failed: {e}")
+            return []
+
     async def search(self, query: str, content: str, top_k: int = 5) -> List[Dict]:
         """
         Perform semantic search on content.
@@ -26,10 +260,14 @@ class SemanticSearchService:
         try:
             sentences = content.split('. ')
             results = []
-            
+
+            # Lower the query once and compare token sets - the old loop
+            # re-lowered the sentence per query word
+            query_words = set(query.lower().split())
+
             for idx, sentence in enumerate(sentences[:top_k]):
                 # Simple keyword matching as mock
-                if any(word in sentence.lower() for word in query.lower().split()):
+                if not query_words.isdisjoint(sentence.lower().split()):
                     results.append({
                         "index": idx,
                         "text": sentence.strip(),
@@ -43,7 +281,104 @@ class SemanticSearchService:
             logger.error(f"❌ Semantic search failed: {e}")
             return []
 
+    async def search_similar(
+        self,
+        query_embedding: List[float],
+        videos: List[Dict],
+        top_k: Optional[int] = None,
+        threshold: Optional[float] = None,
+        assume_normalized: bool = False,
+    ) -> List[Dict]:
+        """
+        Rank videos by embedding similarity to a query.
+
+        Stacks all candidate embeddings into one matrix so every cosine
+        score comes from a single matrix-vector product instead of a
+        per-video Python loop.
+
+        Args:
+            query_embedding: Query embedding vector
+            videos: Candidate videos, each with an "embedding" key
+            top_k: Number of results (defaults to MAX_SEARCH_RESULTS)
+            threshold: Minimum similarity (defaults to SIMILARITY_THRESHOLD)
+            assume_normalized: Set when candidates hold unit vectors, so
+                cosine reduces to a plain dot product
+
+        Returns:
+            Top matches with a "similarity" score, best first
+        """
+        try:
+            top_k = top_k or settings.MAX_SEARCH_RESULTS
+            if threshold is None:
+                threshold = settings.SIMILARITY_THRESHOLD
+
+            candidates = [v for v in videos if v.get("embedding")]
+            if not candidates:
+                return []
+
+            query = np.ascontiguousarray(query_embedding, dtype=np.float32)
+            query_unit = query / (np.linalg.norm(query) + 1e-12)
+
+            # Cheap candidate-set fingerprint: ids plus search params
+            fingerprint = (
+                top_k, threshold, len(candidates),
+                hash(tuple(v.get("id") for v in candidates)),
+            )
+
+            cached = self._sem_cache_get(query_unit, fingerprint)
+            if cached is not None:
+                logger.debug("✅ Semantic cache hit for query")
+                return cached
+
+            matrix = np.ascontiguousarray(
+                [v["embedding"] for v in candidates], dtype=np.float32
+            )
+
+            if assume_normalized:
+                # Ingest already normalized the rows - half the FLOPs and
+                # one less pass over every candidate vector
+                similarities = matrix @ query_unit
+            elif _cosine_kernel is not None:
+                # One fused pass per row: dot and norm accumulate together,
+                # no normalized intermediate matrix is materialized
+                similarities = np.empty(matrix.shape[0], dtype=np.float32)
+                _cosine_kernel(matrix, query_unit, 1.0, similarities)
+            else:
+                matrix /= np.linalg.norm(matrix, axis=1, keepdims=True) + 1e-12
+                similarities = matrix @ query_unit
+            qualified = np.where(similarities >= threshold)[0]
+            if qualified.size == 0:
+                self._sem_cache.append(
+                    (query_unit, fingerprint, [],
+                     time.monotonic() + _SEM_CACHE_TTL)
+                )
+                return []
+
+            # argpartition selects the top k without a full sort; only
+            # the selected handful is then ordered
+            k = min(top_k, qualified.size)
+            top = qualified[np.argpartition(-similarities[qualified], k - 1)[:k]]
+            top = top[np.argsort(-similarities[top])]
+
+            results = [
+                {**candidates[i], "similarity": float(similarities[i])}
+                for i in top.tolist()
+            ]
+
+            self._sem_cache.append(
+                (query_unit, fingerprint, results,
+                 time.monotonic() + _SEM_CACHE_TTL)
+            )
+
+            logger.info(f"✅ Similarity search found {len(results)} results")
+            return results
+
+        except Exception as e:
+            logger.error(f"❌ Similarity search failed: {e}")
+            return []
+
 
+@functools.cache
 def get_semantic_search_service() -> SemanticSearchService:
-    """Get semantic search service instance."""
+    """Get semantic search service instance (singleton)."""
     return SemanticSearchService()
@@ -3,70 +3,156 @@ Video generation service - Tortoise ORM with UTC timezone support
 PRODUCTION GRADE - Complete service for video generation workflow
 """
 
+import functools
 import logging
+import time
 from datetime import datetime, timezone
+from typing import Dict, List, Optional
 
 from app.models.models import Video
 from app.core.constants import VideoStatus
+from app.services.embedding_service import get_embedding_service
 
 logger = logging.getLogger(__name__)
 
+# Plain progress ticks are coalesced to at most one DB write per video
+# in this window; status changes and completion always go through
+_PROGRESS_DEBOUNCE_SECONDS = 0.5
+_last_progress_write: dict = {}
+
 
 class VideoGenerationService:
     """Handle video generation workflow and progress tracking."""
-    
-    async def update_video_progress(self, video_id: int, progress: int, status: str = None) -> Video:
+
+    async def update_video_progress(self, video_id: int, progress: int, status: str = None) -> int:
         """
         Update video generation progress.
-        
+
+        Issues one UPDATE without a prior SELECT - this runs many times
+        per video, so halving round-trips matters.
+
         Args:
             video_id: Video ID
             progress: Progress percentage (0-100)
             status: Optional status update
-        
+
         Returns:
-            Updated video object
+            Number of rows updated (0 when the video does not exist or
+            the write was debounced)
         """
         try:
-            video = await Video.get_or_none(id=video_id)
-            if not video:
-                logger.warning(f"⚠️ Video {video_id} not found for progress update")
-                return None
-            
-            video.progress = max(0, min(100, progress))  # Clamp 0-100
+            progress = max(0, min(100, progress))  # Clamp 0-100
+
+            now = time.monotonic()
+            if status is None and progress < 100:
+                last = _last_progress_write.get(video_id, 0.0)
+                if now - last < _PROGRESS_DEBOUNCE_SECONDS:
+                    return 0
+            _last_progress_write[video_id] = now
+
+            values = {"progress": progress}
             if status:
-                video.status = status
-                logger.debug(f"📊 Video {video_id} status → {status}")
-            
-            await video.save()
-            logger.debug(f"✅ Video {video_id} progress: {video.progress}%")
-            return video
-        
+                values["status"] = status
+                logger.debug("📊 Video %s status → %s", video_id, status)
+
+            updated = await Video.filter(id=video_id).update(**values)
+            if not updated:
+                logger.warning("⚠️ Video %s not found for progress update", video_id)
+                return 0
+
+            # %-style defers formatting until a handler actually wants it
+            logger.debug("✅ Video %s progress: %s%%", video_id, progress)
+            return updated
+
         except Exception as e:
             logger.error(f"❌ Failed to update video progress: {e}", exc_info=True)
             raise
     
-    async def mark_processing(self, video_id: int) -> Video:
+    def generate_video_structure(self, concepts: List[Dict], num_slides: int) -> Dict:
+        """
+        Build a slide structure by distributing concepts across slides.
+
+        The strided buckets are computed once up front rather than
+        re-sliced inside the slide-build loop.
+
+        Args:
+            concepts: Extracted concepts
+            num_slides: Number of slides to produce
+
+        Returns:
+            Structure dict with a "slides" list
+        """
+        try:
+            num_slides = max(1, num_slides)
+            buckets = [concepts[i::num_slides][:3] for i in range(num_slides)]
+
+            slides = [
+                {
+                    "index": i,
+                    "title": bucket[0]["name"] if bucket else f"Slide {i + 1}",
+                    "concepts": bucket,
+                }
+                for i, bucket in enumerate(buckets)
+            ]
+
+            logger.debug(f"✅ Built structure with {len(slides)} slides")
+            return {"slides": slides}
+
+        except Exception as e:
+            logger.error(f"❌ Structure generation failed: {e}", exc_info=True)
+            return {"slides": []}
+
+    async def generate_slide_embeddings(self, structure: Dict) -> List[List[float]]:
+        """
+        Embed every slide of a video structure in one batched call.
+
+        One embed_batch round-trip covers all slides instead of one
+        await per slide.
+
+        Args:
+            structure: Video structure with a "slides" list
+
+        Returns:
+            One embedding per slide, in slide order
+        """
+        try:
+            slides = structure.get("slides", [])
+            if not slides:
+                return []
+
+            texts = [
+                f"{slide.get('title', '')} {slide.get('description', '')}"
+                for slide in slides
+            ]
+            embeddings = await get_embedding_service().embed_batch(texts)
+
+            logger.debug(f"✅ Embedded {len(embeddings)} slides")
+            return embeddings
+
+        except Exception as e:
+            logger.error(f"❌ Slide embedding failed: {e}", exc_info=True)
+            return []
+
+    async def mark_processing(self, video_id: int) -> int:
         """
         Mark video as processing.
-        
+
         Args:
             video_id: Video ID
-        
+
         Returns:
-            Updated video object
+            Number of rows updated
         """
         try:
-            video = await Video.get_or_none(id=video_id)
-            if not video:
+            updated = await Video.filter(id=video_id).update(
+                status=VideoStatus.PROCESSING.value,
+                progress=10,
+            )
+            if not updated:
                 raise ValueError(f"Video {video_id} not found")
-            
-            video.status = VideoStatus.PROCESSING.value
-            video.progress = 10
-            await video.save()
-            
-            logger.info(f"✅ Video {video_id} marked as processing")
-            return video
+
+            logger.info("✅ Video %s marked as processing", video_id)
+            return updated
         except Exception as e:
             logger.error(f"❌ Failed to mark processing: {e}", exc_info=True)
             raise
@@ -78,79 +164,77 @@ class VideoGenerationService:
         file_size: int,
         generation_time: float = None,
         quality_score: float = 0.9
-    ) -> Video:
+    ) -> int:
         """
         Mark video as completed.
-        
+
         Args:
             video_id: Video ID
             output_path: Path to generated video file
             file_size: File size in bytes
             generation_time: Time taken to generate (seconds)
             quality_score: Quality score (0-1)
-        
+
         Returns:
-            Updated video object
+            Number of rows updated
         """
         try:
-            video = await Video.get_or_none(id=video_id)
-            if not video:
+            updated = await Video.filter(id=video_id).update(
+                status=VideoStatus.COMPLETED.value,
+                progress=100,
+                output_path=output_path,
+                file_size=file_size,
+                generation_time=generation_time,
+                quality_score=quality_score,
+                completed_at=datetime.now(timezone.utc),
+            )
+            if not updated:
                 raise ValueError(f"Video {video_id} not found")
-            
-            video.status = VideoStatus.COMPLETED.value
-            video.progress = 100
-            video.output_path = output_path
-            video.file_size = file_size
-            video.generation_time = generation_time
-            video.quality_score = quality_score
-            video.completed_at = datetime.now(timezone.utc)
-            
-            await video.save()
-            
-            logger.info(f"✅ Video {video_id} completed!")
-            logger.info(f"   📁 Output: {output_path}")
-            logger.info(f"   💾 Size: {file_size} bytes")
-            logger.info(f"   ⏱️ Time: {generation_time:.1f}s")
-            logger.info(f"   ⭐ Quality: {quality_score}/1.0")
-            
-            return video
-        
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("✅ Video %s completed!", video_id)
+                logger.info("   📁 Output: %s", output_path)
+                logger.info("   💾 Size: %s bytes", file_size)
+                logger.info("   ⏱️ Time: %.1fs", generation_time)
+                logger.info("   ⭐ Quality: %s/1.0", quality_score)
+
+            return updated
+
         except Exception as e:
             logger.error(f"❌ Failed to mark completed: {e}", exc_info=True)
             raise
     
-    async def mark_failed(self, video_id: int, error_message: str) -> Video:
+    async def mark_failed(self, video_id: int, error_message: str) -> int:
         """
         Mark video as failed.
-        
+
         Args:
             video_id: Video ID
             error_message: Error description
-        
+
         Returns:
-            Updated video object
+            Number of rows updated
         """
         try:
-            video = await Video.get_or_none(id=video_id)
-            if not video:
-                logger.warning(f"⚠️ Video {video_id} not found for error marking")
-                return None
-            
-            video.status = VideoStatus.FAILED.value
-            video.error_message = error_message
-            
-            await video.save()
-            
-            logger.error(f"❌ Video {video_id} marked as FAILED")
-            logger.error(f"   Error: {error_message}")
-            
-            return video
-        
+            updated = await Video.filter(id=video_id).update(
+                status=VideoStatus.FAILED.value,
+                error_message=error_message,
+            )
+            if not updated:
+                logger.warning("⚠️ Video %s not found for error marking", video_id)
+                return 0
+
+            logger.error("❌ Video %s marked as FAILED", video_id)
+            logger.error("   Error: %s", error_message)
+
+            return updated
+
         except Exception as e:
             logger.error(f"❌ Failed to mark failed: {e}", exc_info=True)
             raise
 
 
+@functools.cache
 def get_video_generation_service() -> VideoGenerationService:
     """Get video generation service instance (singleton-like)."""
     return VideoGenerationService()
@@ -6,12 +6,25 @@ Provides helpers for cache key generation and management.
 
 import logging
 import hashlib
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 from app.core.constants import CACHE_KEYS
 
 logger = logging.getLogger(__name__)
 
+try:
+    # xxh3 fingerprints short strings several times faster than md5;
+    # cache keys only need collision resistance, not cryptography
+    import xxhash
+
+    def _fingerprint(data: bytes) -> str:
+        return xxhash.xxh3_64_hexdigest(data)
+
+except ImportError:
+
+    def _fingerprint(data: bytes) -> str:
+        return hashlib.md5(data).hexdigest()
+
 
 class CacheKeyBuilder:
     """Builder for generating cache keys."""
@@ -36,12 +49,12 @@ class CacheKeyBuilder:
         return f"search:{query}:{top_k}"
 
     @staticmethod
-    def embedding_key(text: str) -> str:
+    def embedding_key(text: Union[str, bytes]) -> str:
         """
         Build cache key for embedding.
 
         Args:
-            text: Text to embed
+            text: Text to embed, as str or already-encoded bytes
 
         Returns:
             Cache key with text hash
@@ -51,8 +64,8 @@ class CacheKeyBuilder:
             key = CacheKeyBuilder.embedding_key("Hello world")
             ```
         """
-        text_hash = hashlib.md5(text.encode()).hexdigest()
-        return f"embedding:{text_hash}"
+        data = text.encode() if isinstance(text, str) else text
+        return f"embedding:{_fingerprint(data)}"
 
     @staticmethod
     def video_key(video_id: int) -> str:
@@ -72,6 +85,24 @@ class CacheKeyBuilder:
         """
         return f"video:{video_id}"
 
+    @staticmethod
+    def video_keys_set(video_id: int) -> str:
+        """
+        Build the reverse-index key tracking a video's cache keys.
+
+        Args:
+            video_id: Video ID
+
+        Returns:
+            Cache key for the tracking set
+
+        Example:
+            ```
+            key = CacheKeyBuilder.video_keys_set(123)
+            ```
+        """
+        return f"video:{video_id}:cache_keys"
+
     @staticmethod
     def concept_key(video_id: int) -> str:
         """
@@ -112,6 +143,28 @@ class CacheKeyBuilder:
 class CacheInvalidator:
     """Cache invalidation utilities."""
 
+    @staticmethod
+    async def track_video_key(cache_service, video_id: int, key: str) -> None:
+        """
+        Register a cache key in a video's reverse index.
+
+        Writers of composite keys (search results, derived payloads)
+        call this so invalidation never needs a keyspace scan.
+
+        Args:
+            cache_service: Cache service instance
+            video_id: Video ID
+            key: Cache key that embeds this video
+
+        Example:
+            ```
+            await CacheInvalidator.track_video_key(cache, 123, key)
+            ```
+        """
+        await cache_service.sadd_with_ttl(
+            CacheKeyBuilder.video_keys_set(video_id), key
+        )
+
     @staticmethod
     async def invalidate_video(cache_service, video_id: int) -> None:
         """
@@ -127,17 +180,19 @@ class CacheInvalidator:
             ```
         """
         try:
-            keys = [
-                CacheKeyBuilder.video_key(video_id),
-                CacheKeyBuilder.concept_key(video_id),
-                f"search:*video:{video_id}*",
-            ]
-
-            for key in keys:
-                if "*" in key:
-                    await cache_service.clear_pattern(key)
-                else:
-                    await cache_service.delete(key)
+            # The reverse index replaces the old search:*video:{id}*
+            # keyspace scan - one SMEMBERS plus one pipelined delete
+            keys_set = CacheKeyBuilder.video_keys_set(video_id)
+            tracked = await cache_service.smembers(keys_set)
+
+            await cache_service.pipeline_delete(
+                keys=tracked
+                + [
+                    keys_set,
+                    CacheKeyBuilder.video_key(video_id),
+                    CacheKeyBuilder.concept_key(video_id),
+                ],
+            )
 
             logger.info(f"✅ Invalidated caches for video: {video_id}")
 
@@ -4,12 +4,103 @@ Embedding utility functions.
 Provides helper functions for embedding operations and similarity calculations.
 """
 
+import hashlib
 import logging
+import os
+import platform
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
 import numpy as np
 from typing import List, Tuple, Optional
 
 logger = logging.getLogger(__name__)
 
+try:
+    # Hand-tuned SIMD kernels with no BLAS setup cost per call; wins
+    # most on short (<=512-d) vectors where dispatch overhead dominates.
+    # On ARM it also auto-selects the NEON FMLA cosine path.
+    import simsimd
+except ImportError:
+    simsimd = None
+
+if platform.machine() in ("arm64", "aarch64"):
+    # A generic (non-NEON) BLAS build runs these kernels 2-4x slower on
+    # Graviton/Apple Silicon; surface the backend so misconfigured
+    # deployments are visible (OPENBLAS_CORETYPE=ARMV8 forces NEON)
+    if simsimd is None and logger.isEnabledFor(logging.DEBUG):
+        try:
+            blas = np.__config__.get_info("blas_opt_info") or {}
+            logger.debug(
+                "📊 ARM host without simsimd; NumPy BLAS libraries: %s",
+                blas.get("libraries", "unknown"),
+            )
+        except Exception:
+            logger.debug("📊 ARM host without simsimd; BLAS backend unknown")
+
+
+@dataclass
+class Corpus:
+    """Contiguous float32 matrix holding a corpus of embeddings.
+
+    Row-major structure-of-arrays layout: one ndarray instead of a list
+    of Python lists, so similarity kernels read it without conversion.
+    """
+
+    vectors: np.ndarray
+
+    @classmethod
+    def from_lists(cls, embeddings: List[List[float]]) -> "Corpus":
+        return cls(np.ascontiguousarray(embeddings, dtype=np.float32))
+
+    def __len__(self) -> int:
+        return self.vectors.shape[0]
+
+
+def split_text(
+    content: str,
+    max_words: int = 512,
+    overlap: int = 50,
+) -> List[str]:
+    """
+    Split text into overlapping word-window chunks for embedding.
+
+    Embedding models truncate long inputs, so the document is cut into
+    windows of `max_words` with `overlap` words of context carried
+    between neighbours.
+
+    Args:
+        content: Text to split
+        max_words: Maximum words per chunk
+        overlap: Words shared between consecutive chunks
+
+    Returns:
+        List of text chunks
+
+    Example:
+        ```
+        chunks = split_text(document, max_words=512, overlap=50)
+        ```
+    """
+    try:
+        words = content.split()
+        if not words:
+            return []
+
+        chunks = []
+        step = max(1, max_words - overlap)
+        for start in range(0, len(words), step):
+            chunks.append(" ".join(words[start : start + max_words]))
+            if start + max_words >= len(words):
+                break
+
+        logger.debug(f"✅ Split text into {len(chunks)} chunks")
+        return chunks
+
+    except Exception as e:
+        logger.error(f"❌ Text splitting failed: {e}")
+        return [content]
+
 
 def cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
     """
@@ -24,27 +115,26 @@ def cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
 
     Example:
         ```
-        similarity = cosine_similarity(, )[1]
+        similarity = cosine_similarity(emb1, emb2)
         ```
     """
-    try:
-        v1 = np.array(vec1)
-        v2 = np.array(vec2)
+    # asarray is a no-op for callers that already hold ndarrays, and the
+    # fused vdot form needs one sqrt instead of two norm calls
+    v1 = np.asarray(vec1, dtype=np.float32)
+    v2 = np.asarray(vec2, dtype=np.float32)
 
-        dot_product = np.dot(v1, v2)
-        norm_v1 = np.linalg.norm(v1)
-        norm_v2 = np.linalg.norm(v2)
-
-        if norm_v1 == 0 or norm_v2 == 0:
-            return 0.0
+    if not v1.size or not v2.size:
+        return 0.0
 
-        similarity = dot_product / (norm_v1 * norm_v2)
-        return float(similarity)
+    if simsimd is not None:
+        return 1.0 - float(simsimd.cosine(v1, v2))
 
-    except Exception as e:
-        logger.error(f"❌ Similarity calculation failed: {e}")
+    denom = np.sqrt(np.vdot(v1, v1) * np.vdot(v2, v2))
+    if denom == 0:
         return 0.0
 
+    return float(np.dot(v1, v2) / denom)
+
 
 def euclidean_distance(vec1: List[float], vec2: List[float]) -> float:
     """
@@ -63,41 +153,90 @@ def euclidean_distance(vec1: List[float], vec2: List[float]) -> float:
         ```
     """
     try:
-        v1 = np.array(vec1)
-        v2 = np.array(vec2)
+        v1 = np.asarray(vec1, dtype=np.float32)
+        v2 = np.asarray(vec2, dtype=np.float32)
 
-        distance = np.linalg.norm(v1 - v2)
-        return float(distance)
+        # ||a-b||^2 = ||a||^2 + ||b||^2 - 2ab avoids the temp diff array
+        sq = np.vdot(v1, v1) + np.vdot(v2, v2) - 2.0 * np.dot(v1, v2)
+        return float(np.sqrt(max(sq, 0.0)))
 
     except Exception as e:
         logger.error(f"❌ Distance calculation failed: {e}")
         return float("inf")
 
 
-def normalize_embedding(embedding: List[float]) -> List[float]:
+def euclidean_distance_batch(
+    query: List[float],
+    candidates: np.ndarray,
+    candidate_sq_norms: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Euclidean distances from one query to every candidate row.
+
+    Uses the dot-product decomposition so the per-candidate squared
+    norms can be computed once at ingestion and reused across queries,
+    reducing each call to a single GEMV.
+
+    Args:
+        query: Query embedding vector
+        candidates: Candidate matrix (candidates x dims)
+        candidate_sq_norms: Precomputed per-row squared norms, if any
+
+    Returns:
+        Distance per candidate, in row order
+
+    Example:
+        ```
+        c_sq = np.einsum('ij,ij->i', matrix, matrix)
+        distances = euclidean_distance_batch(query, matrix, c_sq)
+        ```
+    """
+    try:
+        matrix = _as_matrix(candidates)
+        if candidate_sq_norms is None:
+            candidate_sq_norms = np.einsum("ij,ij->i", matrix, matrix)
+
+        q = np.asarray(query, dtype=np.float32)
+        q_sq = float(np.vdot(q, q))
+        inner = matrix @ q
+        return np.sqrt(
+            np.maximum(candidate_sq_norms + q_sq - 2.0 * inner, 0.0)
+        )
+
+    except Exception as e:
+        logger.error(f"❌ Batch distance calculation failed: {e}")
+        return np.array([])
+
+
+def normalize_embedding(embedding: List[float], as_list: bool = True):
     """
     Normalize embedding vector to unit length.
 
     Args:
         embedding: Embedding vector
+        as_list: Return a Python list (back-compat); pass False to get
+            the float32 ndarray and skip the O(D) list materialization
 
     Returns:
         Normalized embedding
 
     Example:
         ```
-        normalized = normalize_embedding()[1]
+        normalized = normalize_embedding(embedding)
         ```
     """
     try:
-        vec = np.array(embedding)
-        norm = np.linalg.norm(vec)
+        vec = np.asarray(embedding, dtype=np.float32)
+        if vec is embedding or vec.base is embedding:
+            vec = vec.copy()
 
+        norm = np.sqrt(np.vdot(vec, vec))
         if norm == 0:
             return embedding
 
-        normalized = (vec / norm).tolist()
-        return normalized
+        # In-place divide - no second full-vector allocation
+        np.divide(vec, norm, out=vec)
+        return vec.tolist() if as_list else vec
 
     except Exception as e:
         logger.error(f"❌ Normalization failed: {e}")
@@ -130,33 +269,162 @@ def find_nearest_neighbors(
         ```
     """
     try:
-        similarities = []
-
-        for idx, emb in enumerate(embeddings):
-            sim = cosine_similarity(query_embedding, emb)
-            similarities.append((idx, sim))
+        if not embeddings:
+            return []
+
+        # One GEMV over the stacked candidates replaces N Python-level
+        # cosine calls; argpartition keeps top-k selection O(N)
+        candidates = np.asarray(embeddings, dtype=np.float32)
+        candidates = candidates / (
+            np.linalg.norm(candidates, axis=1, keepdims=True) + 1e-12
+        )
+        query = np.asarray(query_embedding, dtype=np.float32)
+        query = query / (np.linalg.norm(query) + 1e-12)
 
-        # Sort by similarity descending
-        similarities.sort(key=lambda x: x[1], reverse=True)
+        sims = candidates @ query
+        k = min(k, sims.size)
+        idx = np.argpartition(-sims, k - 1)[:k]
+        idx = idx[np.argsort(-sims[idx])]
 
-        logger.debug(f"✅ Found {len(similarities)} neighbors")
-        return similarities[:k]
+        logger.debug(f"✅ Found {sims.size} neighbors")
+        return list(zip(idx.tolist(), sims[idx].tolist()))
 
     except Exception as e:
         logger.error(f"❌ Neighbor search failed: {e}")
         return []
 
 
+class EmbeddingStore:
+    """Memory-mapped float32 embedding matrix persisted on disk.
+
+    Large corpora are served straight from the page cache instead of
+    being re-materialized as a fresh contiguous buffer on every
+    batch_similarity call; BLAS streams the rows natively.
+    """
+
+    _GROWTH = 1024  # rows added per file extension
+
+    def __init__(self, path: str, dim: int):
+        self.path = Path(path)
+        self.dim = dim
+        self.count = 0
+        self._capacity = 0
+        self.arr: Optional[np.ndarray] = None
+
+        if self.path.exists() and self.path.stat().st_size:
+            self._capacity = self.path.stat().st_size // (dim * 4)
+            self.count = self._capacity
+            self._map()
+
+    def _map(self) -> None:
+        self.arr = np.memmap(
+            self.path,
+            dtype=np.float32,
+            mode="r+",
+            shape=(self._capacity, self.dim),
+        )
+
+    def _grow(self, min_capacity: int) -> None:
+        new_capacity = max(min_capacity, self._capacity + self._GROWTH)
+        if self.arr is not None:
+            self.arr.flush()
+            del self.arr
+        with open(self.path, "ab") as f:
+            f.truncate(new_capacity * self.dim * 4)
+        self._capacity = new_capacity
+        self._map()
+
+    def append(self, vec: List[float]) -> int:
+        """Append one embedding, extending the backing file as needed."""
+        if self.count >= self._capacity:
+            self._grow(self.count + 1)
+        self.arr[self.count] = np.asarray(vec, dtype=np.float32)
+        self.count += 1
+        return self.count - 1
+
+    def vectors(self) -> np.ndarray:
+        """View of the populated rows (no copy)."""
+        if self.arr is None:
+            return np.empty((0, self.dim), dtype=np.float32)
+        return self.arr[: self.count]
+
+    def flush(self) -> None:
+        """Push pending writes to disk."""
+        if self.arr is not None:
+            self.arr.flush()
+
+
+def _as_matrix(embeddings) -> np.ndarray:
+    """Coerce list / ndarray / Corpus / EmbeddingStore to a float32 matrix."""
+    if isinstance(embeddings, EmbeddingStore):
+        return embeddings.vectors()
+    if isinstance(embeddings, Corpus):
+        return embeddings.vectors
+    return np.asarray(embeddings, dtype=np.float32)
+
+
+# Candidate corpora (a video's chunk embeddings) are reused across many
+# queries; caching their normalized matrix keyed by content skips the
+# repeated allocate-and-divide on every call. Content keys (a blake2b
+# of the raw float32 bytes) stay valid across garbage collection and
+# in-place mutation, unlike id()-based keys
+_normalized_cache: dict = {}
+_NORMALIZED_CACHE_MAX = 32
+
+
+def precompute_candidates(
+    candidate_embeddings: List[List[float]],
+) -> np.ndarray:
+    """
+    Normalize a candidate corpus once and cache the result.
+
+    Args:
+        candidate_embeddings: List of candidate embeddings
+
+    Returns:
+        L2-normalized float32 matrix (candidates x dims)
+
+    Example:
+        ```
+        matrix = precompute_candidates(all_embeddings)
+        ```
+    """
+    candidates = _as_matrix(candidate_embeddings)
+    key = hashlib.blake2b(
+        np.ascontiguousarray(candidates).tobytes(), digest_size=16
+    ).digest()
+    cached = _normalized_cache.get(key)
+    if cached is not None:
+        return cached
+
+    candidates = candidates / (
+        np.linalg.norm(candidates, axis=1, keepdims=True) + 1e-12
+    )
+
+    if len(_normalized_cache) >= _NORMALIZED_CACHE_MAX:
+        _normalized_cache.pop(next(iter(_normalized_cache)))
+    _normalized_cache[key] = candidates
+    return candidates
+
+
+# Candidate rows processed per matmul tile; sized so a tile of
+# 1536-d float32 vectors stays within a typical L2 cache
+_SIMILARITY_TILE = 8192
+
+
 def batch_similarity(
     query_embeddings: List[List[float]],
     candidate_embeddings: List[List[float]],
+    tile: int = _SIMILARITY_TILE,
 ) -> np.ndarray:
     """
     Calculate similarity matrix between query and candidate embeddings.
 
     Args:
         query_embeddings: List of query embeddings
-        candidate_embeddings: List of candidate embeddings
+        candidate_embeddings: Candidate embeddings as a list, ndarray,
+            Corpus, or EmbeddingStore
+        tile: Candidate rows per matmul block (cache-blocking size)
 
     Returns:
         Similarity matrix (shape: queries x candidates)
@@ -170,17 +438,39 @@ def batch_similarity(
         ```
     """
     try:
-        queries = np.array(query_embeddings)
-        candidates = np.array(candidate_embeddings)
-
-        # Normalize for cosine similarity
-        queries_norm = queries / np.linalg.norm(queries, axis=1, keepdims=True)
-        candidates_norm = candidates / np.linalg.norm(
-            candidates, axis=1, keepdims=True
+        if simsimd is not None:
+            queries = np.ascontiguousarray(query_embeddings, dtype=np.float32)
+            candidates = np.ascontiguousarray(_as_matrix(candidate_embeddings))
+            similarity_matrix = 1.0 - np.asarray(
+                simsimd.cdist(queries, candidates, metric="cosine"),
+                dtype=np.float32,
+            )
+            logger.debug(
+                f"✅ Computed similarity matrix: {similarity_matrix.shape}"
+            )
+            return similarity_matrix
+
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        norms += 1e-12
+        # Divide into a preallocated buffer - the broadcast expression
+        # would allocate the norm result and a second full Q matrix
+        queries_norm = np.empty_like(queries)
+        np.divide(queries, norms, out=queries_norm)
+        candidates_norm = precompute_candidates(candidate_embeddings)
+
+        # Tile the candidate axis so each block's slice of the result
+        # and the query block stay cache-resident; out= writes each
+        # block in place without an intermediate allocation
+        n = candidates_norm.shape[0]
+        similarity_matrix = np.empty(
+            (queries_norm.shape[0], n), dtype=np.float32
         )
-
-        # Compute similarity matrix
-        similarity_matrix = np.dot(queries_norm, candidates_norm.T)
+        for start in range(0, n, tile):
+            end = min(start + tile, n)
+            similarity_matrix[:, start:end] = (
+                queries_norm @ candidates_norm[start:end].T
+            )
 
         logger.debug(
             f"✅ Computed similarity matrix: {similarity_matrix.shape}"
@@ -192,6 +482,73 @@ def batch_similarity(
         return np.array([])
 
 
+def quantize_int8(vectors: np.ndarray) -> Tuple[np.ndarray, float]:
+    """
+    Quantize a float matrix to int8 with a single symmetric scale.
+
+    int8 storage cuts memory traffic 4x versus float32, which is the
+    bottleneck for large-corpus similarity scans.
+
+    Args:
+        vectors: Embedding matrix (rows are vectors)
+
+    Returns:
+        Tuple of (int8 matrix, scale to recover float values)
+
+    Example:
+        ```
+        q_vectors, scale = quantize_int8(corpus.vectors)
+        ```
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    max_abs = float(np.abs(vectors).max()) if vectors.size else 0.0
+    if max_abs == 0.0:
+        return np.zeros(vectors.shape, dtype=np.int8), 1.0
+
+    scale = max_abs / 127.0
+    quantized = np.round(vectors / scale).astype(np.int8)
+    return quantized, scale
+
+
+def batch_similarity_int8(
+    query_int8: np.ndarray,
+    candidate_int8: np.ndarray,
+    query_scale: float,
+    candidate_scale: float,
+) -> np.ndarray:
+    """
+    Dot-product similarity matrix between int8-quantized embeddings.
+
+    Accumulates in wider integers (NumPy routes the einsum through its
+    optimized contraction kernels) and rescales once at the end.
+
+    Args:
+        query_int8: Quantized query matrix
+        candidate_int8: Quantized candidate matrix
+        query_scale: Scale from quantize_int8 for the queries
+        candidate_scale: Scale from quantize_int8 for the candidates
+
+    Returns:
+        Similarity matrix (shape: queries x candidates)
+
+    Example:
+        ```
+        sims = batch_similarity_int8(q_i8, c_i8, q_scale, c_scale)
+        ```
+    """
+    try:
+        products = np.einsum(
+            "ij,kj->ik",
+            query_int8.astype(np.int32),
+            candidate_int8.astype(np.int32),
+        )
+        return products.astype(np.float32) * (query_scale * candidate_scale)
+
+    except Exception as e:
+        logger.error(f"❌ int8 batch similarity failed: {e}")
+        return np.array([])
+
+
 def embedding_hash(embedding: List[float]) -> str:
     """
     Create hash of embedding for caching.
@@ -208,13 +565,45 @@ def embedding_hash(embedding: List[float]) -> str:
         ```
     """
     try:
-        import hashlib
-
-        # Convert to string and hash
-        embedding_str = str(embedding)
-        hash_obj = hashlib.sha256(embedding_str.encode())
-        return hash_obj.hexdigest()
+        # Hashing the raw float32 buffer avoids the ~25-bytes-per-float
+        # repr string the old str(embedding) approach allocated
+        arr = np.ascontiguousarray(embedding, dtype=np.float32)
+        return hashlib.sha256(arr.tobytes()).hexdigest()
 
     except Exception as e:
         logger.error(f"❌ Hashing failed: {e}")
         return ""
+
+
+def embedding_hashes(embeddings: List[List[float]]) -> List[str]:
+    """
+    Hash a batch of embeddings across threads.
+
+    hashlib releases the GIL for buffers over 2 KB, and a float32
+    embedding of typical dimension clears that, so bulk-ingestion
+    hashing scales across cores.
+
+    Args:
+        embeddings: Embedding vectors to hash
+
+    Returns:
+        Hash strings in input order
+
+    Example:
+        ```
+        hashes = embedding_hashes(all_embeddings)
+        ```
+    """
+    try:
+        if not embeddings:
+            return []
+        if len(embeddings) == 1:
+            return [embedding_hash(embeddings[0])]
+
+        workers = min(len(embeddings), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(embedding_hash, embeddings))
+
+    except Exception as e:
+        logger.error(f"❌ Batch hashing failed: {e}")
+        return [embedding_hash(emb) for emb in embeddings]
@@ -17,6 +17,9 @@ COMPLETE VIDEO GENERATION PIPELINE
 
 import logging
 import asyncio
+import functools
+import hashlib
+import shutil
 import threading
 import os
 import json
@@ -25,14 +28,60 @@ import subprocess
 import numpy as np
 import yaml
 import PyPDF2
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple
 from datetime import datetime, timezone
 import soundfile as sf
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageFont
 
 logger = logging.getLogger(__name__)
-_completed_videos = {}
+
+try:
+    # Ships frame buffers to the ffmpeg pipe from a C++ thread without
+    # holding the GIL, overlapping the write with the next render
+    import turbopipe
+except ImportError:
+    turbopipe = None
+
+try:
+    # orjson serializes straight to UTF-8 bytes, 5-10x faster than the
+    # stdlib and with no ensure_ascii toggles
+    import orjson
+
+    def _json_dumps_pretty(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+
+    def _json_dumps_pretty(obj) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _write_file(path: str, data) -> None:
+    """Blocking write of str or bytes; run via asyncio.to_thread so a
+    slow disk never stalls the event loop mid-pipeline."""
+    if isinstance(data, bytes):
+        with open(path, 'wb') as f:
+            f.write(data)
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(data)
+
+
+# Bounded insertion-ordered record of terminal video states; the old
+# plain dict grew without limit in long-running workers
+_completed_videos = OrderedDict()
+_COMPLETED_VIDEOS_MAX = 10_000
+
+
+def _record_completed_video(video_id: int, payload: dict) -> None:
+    """Store a terminal video state, evicting the oldest past the cap."""
+    _completed_videos[video_id] = payload
+    _completed_videos.move_to_end(video_id)
+    while len(_completed_videos) > _COMPLETED_VIDEOS_MAX:
+        _completed_videos.popitem(last=False)
 
 # ════════════════════════════════════════════════════════════════════════════════
 # LOAD CONFIGURATION
@@ -63,6 +112,8 @@ def load_yaml_config(config_name: str) -> Dict:
         logger.warning(f"Failed to load {config_name}.yaml: {e}")
         return {}
 
+from app.workers.llm_cache import get_or_generate
+
 SCRIPT_PROMPTS = load_yaml_config("script_generation")
 logger.info(f"✅ YAML prompts loaded")
 
@@ -75,28 +126,67 @@ class PDFExtractor:
     
     @staticmethod
     def extract_pdf_content(file_path: str) -> Dict:
-        """Extract PDF content."""
+        """Extract PDF content.
+
+        Prefers PyMuPDF (C library, 10-50x faster than pure-Python
+        PyPDF2 on large documents); falls back to PyPDF2 when it is
+        not installed.
+        """
         try:
             logger.info(f"Extracting PDF: {file_path}")
-            
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                
-                full_text = []
-                for page_num, page in enumerate(pdf_reader.pages):
-                    text = page.extract_text()
-                    full_text.append(text)
-                
-                content = "\n\n".join(full_text)
-                
-                logger.info(f"✅ PDF extracted: {len(content)} chars, {len(pdf_reader.pages)} pages")
-                
-                return {
-                    "content": content,
-                    "pages": len(pdf_reader.pages),
-                    "source": "pdf"
-                }
-        
+
+            try:
+                import fitz
+
+                doc = fitz.open(file_path)
+                try:
+                    pages = doc.page_count
+                    if pages >= 4:
+                        # Page ranges split across threads; each worker
+                        # opens its own handle since a fitz document is
+                        # not safe for concurrent page access
+                        doc.close()
+                        doc = None
+                        step = max(1, pages // min(8, os.cpu_count() or 1))
+
+                        def _pages_text(start: int) -> List[str]:
+                            worker_doc = fitz.open(file_path)
+                            try:
+                                return [
+                                    worker_doc.load_page(i).get_text()
+                                    for i in range(start, min(start + step, pages))
+                                ]
+                            finally:
+                                worker_doc.close()
+
+                        with ThreadPoolExecutor(
+                            max_workers=min(8, os.cpu_count() or 1)
+                        ) as executor:
+                            chunks = executor.map(
+                                _pages_text, range(0, pages, step)
+                            )
+                            full_text = [t for chunk in chunks for t in chunk]
+                    else:
+                        full_text = [page.get_text() for page in doc]
+                finally:
+                    if doc is not None:
+                        doc.close()
+            except ImportError:
+                with open(file_path, 'rb') as file:
+                    pdf_reader = PyPDF2.PdfReader(file)
+                    full_text = [page.extract_text() for page in pdf_reader.pages]
+                    pages = len(pdf_reader.pages)
+
+            content = "\n\n".join(full_text)
+
+            logger.info(f"✅ PDF extracted: {len(content)} chars, {pages} pages")
+
+            return {
+                "content": content,
+                "pages": pages,
+                "source": "pdf"
+            }
+
         except Exception as e:
             logger.error(f"PDF extraction failed: {e}")
             return {"content": "", "pages": 0, "source": "pdf"}
@@ -114,9 +204,9 @@ Title: {title}
 Content: {content[:2000]}"""
             
             logger.debug("Extracting key points from PDF")
-            response = model.generate_content(prompt)
+            text = await get_or_generate(model, prompt)
             
-            key_points = [p.strip() for p in response.text.split('\n') if p.strip()]
+            key_points = [p.strip() for p in text.split('\n') if p.strip()]
             logger.info(f"✅ Key points: {len(key_points)}")
             
             return key_points
@@ -141,6 +231,11 @@ class VideoConfig:
     
     FPS = settings.VIDEO_FPS
     VIDEO_CODEC = "libx264"
+    # Generated frames are static slides with a slow gradient - a fast
+    # preset with stillimage tuning encodes 3-8x quicker at the same
+    # visual quality, and B-frames buy nothing without motion
+    X264_PRESET = "veryfast"
+    X264_TUNE = "stillimage"
     AUDIO_CODEC = "aac"
     TTS_VOICE = "bf_isabella"
     TTS_SAMPLE_RATE = 24000
@@ -182,44 +277,463 @@ class VideoConfig:
 # DB UPDATE
 # ════════════════════════════════════════════════════════════════════════════════
 
-def update_video_progress_sync(video_id: int, step: int, total_steps: int, 
-                               status: str = "processing", **kwargs) -> None:
-    """Update video progress."""
-    try:
-        from app.models.models import Video
-        
-        async def _update():
-            progress = int((step / total_steps) * 100)
-            video = await Video.get_or_none(id=video_id)
-            if video:
-                video.progress = progress
-                video.status = status
-                video.updated_at = datetime.now(timezone.utc)
-                
-                for key, value in kwargs.items():
-                    if hasattr(video, key):
-                        setattr(video, key, value)
-                
-                await video.save()
-                
-                log_msg = f"[DB] Video {video_id}: {progress}% | Step {step}/{total_steps}"
+# One daemon thread owns a private event loop for all progress writes.
+# Callers just merge their latest state into _pending_updates and the
+# flusher coalesces rapid step updates into one UPDATE per interval -
+# no per-call get_event_loop/new_event_loop dance, far fewer writes.
+_db_loop: Optional[asyncio.AbstractEventLoop] = None
+_db_loop_lock = threading.Lock()
+_pending_updates: Dict[int, dict] = {}
+_FLUSH_INTERVAL_SECONDS = 0.2
+
+
+async def _flush_progress_updates() -> None:
+    """Drain the coalesced progress states on a fixed cadence."""
+    from app.models.models import Video
+
+    while True:
+        await asyncio.sleep(_FLUSH_INTERVAL_SECONDS)
+        for video_id in list(_pending_updates.keys()):
+            values = _pending_updates.pop(video_id, None)
+            if values is None:
+                continue
+            try:
+                await Video.filter(id=video_id).update(**values)
+                log_msg = f"[DB] Video {video_id}: {values.get('progress')}%"
                 logger.info(log_msg)
                 print(f"💾 {log_msg}")
-        
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                asyncio.ensure_future(_update())
-            else:
-                loop.run_until_complete(_update())
-        except RuntimeError:
+            except Exception as e:
+                logger.error(f"DB update failed: {e}")
+
+
+def _get_db_loop() -> asyncio.AbstractEventLoop:
+    """Start the dedicated DB writer loop on first use."""
+    global _db_loop
+    with _db_loop_lock:
+        if _db_loop is None:
             loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(_update())
-    
+            threading.Thread(
+                target=loop.run_forever, daemon=True, name="video-db-writer"
+            ).start()
+            asyncio.run_coroutine_threadsafe(_flush_progress_updates(), loop)
+            _db_loop = loop
+    return _db_loop
+
+
+def update_video_progress_sync(video_id: int, step: int, total_steps: int,
+                               status: str = "processing", **kwargs) -> None:
+    """Queue a video progress update for the DB writer thread."""
+    try:
+        from app.models.models import Video
+
+        values = {
+            "progress": int((step / total_steps) * 100),
+            "status": status,
+            "updated_at": datetime.now(timezone.utc),
+        }
+        values.update({
+            key: value for key, value in kwargs.items()
+            if key in Video._meta.fields_map
+        })
+
+        merged = _pending_updates.get(video_id)
+        if merged is not None:
+            merged.update(values)
+        else:
+            _pending_updates[video_id] = values
+
+        _get_db_loop()
+
     except Exception as e:
         logger.error(f"DB update failed: {e}")
 
+# ════════════════════════════════════════════════════════════════════════════════
+# ENCODER SELECTION
+# ════════════════════════════════════════════════════════════════════════════════
+
+# Resolved once at import; per-call os.environ['PATH'] mutation was
+# non-atomic across worker threads and rescanned PATH on every compile
+FFMPEG_BIN = shutil.which('ffmpeg') or r"C:\Program Files\FFmpeg\bin\ffmpeg.exe"
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_h264_encoder() -> str:
+    """Probe ffmpeg once for a hardware H.264 encoder.
+
+    NVENC/QSV/VideoToolbox move the encode off the CPU entirely,
+    freeing cores for frame rendering and concurrent jobs; libx264 is
+    the fallback.
+    """
+    try:
+        result = subprocess.run(
+            [FFMPEG_BIN, '-hide_banner', '-encoders'],
+            capture_output=True, text=True, timeout=15
+        )
+        for name in ('h264_nvenc', 'h264_qsv', 'h264_videotoolbox'):
+            if name not in result.stdout:
+                continue
+            # Being compiled in does not mean hardware is present -
+            # stock builds list nvenc/qsv on GPU-less hosts. A one-
+            # frame test encode proves the encoder actually opens
+            try:
+                test = subprocess.run(
+                    [FFMPEG_BIN, '-hide_banner', '-loglevel', 'error',
+                     '-f', 'lavfi', '-i', 'color=c=black:s=64x64:d=0.1',
+                     '-frames:v', '1', '-c:v', name, '-f', 'null', '-'],
+                    capture_output=True, timeout=30
+                )
+            except Exception:
+                continue
+            if test.returncode == 0:
+                logger.info(f"✅ Hardware H.264 encoder available: {name}")
+                return name
+            logger.warning(
+                f"⚠️ {name} is compiled in but failed a test encode; skipping"
+            )
+    except Exception as e:
+        logger.warning(f"⚠️ Encoder probe failed: {e}")
+    return 'libx264'
+
+
+def _h264_encoder_args(codec: str, crf: int, fps: int) -> List[str]:
+    """Build the codec-specific part of the ffmpeg command."""
+    if codec == 'h264_nvenc':
+        return ['-c:v', 'h264_nvenc', '-preset', 'p4', '-tune', 'hq',
+                '-rc', 'vbr', '-cq', str(crf), '-b:v', '0']
+    if codec == 'h264_qsv':
+        return ['-c:v', 'h264_qsv', '-global_quality', str(crf),
+                '-preset', 'veryfast']
+    if codec == 'h264_videotoolbox':
+        return ['-c:v', 'h264_videotoolbox', '-q:v', '65']
+    return ['-c:v', 'libx264',
+            '-preset', VideoConfig.X264_PRESET,
+            '-tune', VideoConfig.X264_TUNE,
+            '-crf', str(crf),
+            '-g', str(fps * 2),
+            '-bf', '0',
+            '-threads', '0']
+
+# ════════════════════════════════════════════════════════════════════════════════
+# FRAME RENDERING
+# ════════════════════════════════════════════════════════════════════════════════
+
+try:
+    # Fuses gradient, clip, and channel writes into one parallel pass
+    # over the frame buffer - no NumPy temporaries at all
+    from numba import njit, prange
+
+    @njit(parallel=True, cache=True)
+    def _fill_gradient(out, r_off, g_off, b_off):  # pragma: no cover - compiled
+        height, width = out.shape[0], out.shape[1]
+        for y in prange(height):
+            r = min(255, max(0, 15 + r_off + (y // 10) % 30))
+            g = min(255, max(0, 23 + g_off + (y // 8) % 25))
+            b = min(255, max(0, 42 + b_off + (y // 6) % 40))
+            for x in range(width):
+                out[y, x, 0] = r
+                out[y, x, 1] = g
+                out[y, x, 2] = b
+
+    # Warm the JIT at import so the first real frame is not the one
+    # paying compilation; cache=True makes later imports near-free
+    _fill_gradient(np.empty((2, 2, 3), dtype=np.uint8), 0, 0, 0)
+
+except ImportError:
+    _fill_gradient = None
+
+
+# Candidate fonts per platform; FreeType face construction is paid
+# once per size instead of once per frame
+_FONT_CANDIDATES = (
+    "C:\\Windows\\Fonts\\arial.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/System/Library/Fonts/Helvetica.ttc",
+)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_font(size: int) -> ImageFont.ImageFont:
+    """Load a TrueType font once per size, falling back to the default."""
+    for path in _FONT_CANDIDATES:
+        try:
+            return ImageFont.truetype(path, size)
+        except OSError:
+            continue
+    return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=256)
+def _text_mask(text: str, size: int) -> Tuple[np.ndarray, Tuple[int, int]]:
+    """Rasterize a string once into an alpha mask plus draw offset.
+
+    ImageDraw.text re-runs FreeType layout and rasterization on every
+    call, and the animation repeats the same few strings for hundreds
+    of frames - only their position changes. Caching the mask per
+    (text, size) leaves a memory-bound alpha blit in the frame loop.
+    """
+    font = _load_font(size)
+    try:
+        mask, offset = font.getmask2(text, mode="L")
+    except AttributeError:
+        mask, offset = font.getmask(text, mode="L"), (0, 0)
+    w, h = mask.size
+    # The ImagingCore mask exposes the buffer protocol, so frombytes is
+    # a public-API copy into an "L" image (no Image.Image()._new)
+    mask_img = Image.frombytes("L", (w, h), bytes(mask))
+    alpha = np.asarray(mask_img, dtype=np.float32) / 255.0
+    return alpha.reshape(h, w), offset
+
+
+@functools.lru_cache(maxsize=256)
+def _colored_mask(text: str, size: int,
+                  color: tuple) -> Tuple[np.ndarray, np.ndarray, Tuple[int, int]]:
+    """Premultiplied color and inverse alpha for one (text, color).
+
+    Precomputing color*alpha and 1-alpha once per string turns the
+    per-frame blend into a single multiply plus an in-place add.
+    """
+    alpha, offset = _text_mask(text, size)
+    a = alpha[..., None]
+    colored = np.asarray(color, dtype=np.float32) * a
+    return colored, 1.0 - a, offset
+
+
+def _blit_text(arr: np.ndarray, text: str, size: int,
+               x: int, y: int, color: tuple) -> None:
+    """Alpha-blend a cached text mask into the frame at (x, y)."""
+    colored, inv_a, (ox, oy) = _colored_mask(text, size, color)
+    x, y = x + ox, y + oy
+    h, w = inv_a.shape[:2]
+    frame_h, frame_w = arr.shape[:2]
+    # Text slides in from off-screen, so clip against the frame edges
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + w, frame_w), min(y + h, frame_h)
+    if x0 >= x1 or y0 >= y1:
+        return
+    region = arr[y0:y1, x0:x1]
+    blended = region * inv_a[y0 - y:y1 - y, x0 - x:x1 - x]
+    blended += colored[y0 - y:y1 - y, x0 - x:x1 - x]
+    region[:] = blended
+
+
+@functools.lru_cache(maxsize=256)
+def _layout_lines(text: str, size: int, max_width: int) -> Tuple[str, ...]:
+    """Wrap text on word boundaries to fit max_width, once per string.
+
+    Replaces the old line[:50] truncation, which could cut mid-word
+    and pushed glyphs off-screen; widths are measured with the same
+    font the blit path renders with, and the layout is cached so the
+    per-frame loop just iterates strings.
+    """
+    font = _load_font(size)
+    try:
+        measure = font.getlength
+    except AttributeError:
+        measure = lambda s: font.getsize(s)[0]
+
+    lines = []
+    for raw_line in text.split('\n'):
+        words = raw_line.split()
+        if not words:
+            continue
+        line = words[0]
+        for word in words[1:]:
+            candidate = f"{line} {word}"
+            if measure(candidate) <= max_width:
+                line = candidate
+            else:
+                lines.append(line)
+                line = word
+        lines.append(line)
+    return tuple(lines)
+
+
+@functools.lru_cache(maxsize=4)
+def _gradient_bases(height: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Per-height gradient base vectors; identical for every frame."""
+    ys = np.arange(height, dtype=np.int32)
+    return (
+        15 + (ys // 10) % 30,
+        23 + (ys // 8) % 25,
+        42 + (ys // 6) % 40,
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _gradient_column(height: int,
+                     r_off: int, g_off: int, b_off: int) -> np.ndarray:
+    """One (H, 3) gradient column per truncated-offset bucket.
+
+    The gradient only varies with y, so caching the column instead of
+    the finished frame keeps each entry at a few KB rather than the
+    ~2.7 MB a full 1280x720 frame costs - the old full-frame cache
+    could pin ~175 MB per pool worker. The progress coefficients max
+    out at 50, so a whole video produces at most ~50 distinct columns.
+    """
+    base_r, base_g, base_b = _gradient_bases(height)
+    r = np.clip(base_r + r_off, 0, 255)
+    g = np.clip(base_g + g_off, 0, 255)
+    b = np.clip(base_b + b_off, 0, 255)
+    return np.stack([r, g, b], axis=1).astype(np.uint8)
+
+
+# One gradient buffer per worker process, reused across frames. Safe
+# because each worker renders frames serially and every caller copies
+# the pixels out (save / tobytes) before the next frame is built
+_gradient_buffer: Optional[np.ndarray] = None
+
+
+def _build_frame(
+    concept: str, index: int, total: int,
+    frame_in_seq: int, total_frames_in_seq: int
+) -> np.ndarray:
+    """Render one animated frame as an (H, W, 3) uint8 array.
+
+    The whole frame assembles in NumPy - gradient fill, slice writes,
+    mask blits - so no PIL objects are allocated in the hot loop; the
+    array ships to ffmpeg as raw bytes without a conversion.
+    """
+    global _gradient_buffer
+
+    resolution = VideoConfig.get_resolution("horizontal")
+    width, height = resolution
+
+    progress = frame_in_seq / total_frames_in_seq
+
+    if _gradient_buffer is None or _gradient_buffer.shape[:2] != (height, width):
+        _gradient_buffer = np.empty((height, width, 3), dtype=np.uint8)
+    arr = _gradient_buffer
+
+    # Gradient fill into the reusable buffer: the numba kernel writes
+    # it in one parallel pass, otherwise the cached (H, 3) column for
+    # this truncated-offset bucket broadcasts across the rows
+    if _fill_gradient is not None:
+        _fill_gradient(
+            arr,
+            int(progress * 40), int(progress * 30), int(progress * 50),
+        )
+    else:
+        column = _gradient_column(
+            height,
+            int(progress * 40), int(progress * 30), int(progress * 50),
+        )
+        arr[:] = column[:, None, :]
+
+    # Rows 0-15 and the bottom 20, matching PIL's inclusive coordinates
+    arr[:16] = VideoConfig.ACCENT_COLOR
+    arr[height - 20:] = VideoConfig.ACCENT_COLOR
+
+    # Text and the progress bar composite straight into the array:
+    # strings rasterize once into cached masks and each frame pays
+    # only the alpha blit, not FreeType layout
+    slide_distance = -1280 + (progress * 1280)
+    text_x = int(260 + slide_distance)
+    y_offset = 300
+
+    # The text settles at x=260; wrap against the remaining width with
+    # a right margin instead of truncating at 50 chars
+    for line in _layout_lines(concept, 60, width - 320):
+        _blit_text(arr, line, 60,
+                   text_x + 2, y_offset + 3, VideoConfig.SHADOW_COLOR)
+        _blit_text(arr, line, 60,
+                   text_x, y_offset + 1, VideoConfig.ACCENT_COLOR)
+        y_offset += 100
+
+    # The progress bar was always ACCENT drawn over the full-width
+    # ACCENT bottom bar - a no-op since the original renderer - so
+    # only the index label remains to composite
+    _blit_text(arr, f"{index}/{total}", 40,
+               1200, height - 40, VideoConfig.TEXT_COLOR)
+
+    return arr
+
+
+def render_frame(args: tuple) -> str:
+    """Render and save one frame; module-level so it pickles to workers.
+
+    Frames only depend on their own arguments, so generation is
+    embarrassingly parallel across a process pool. Identical argument
+    tuples (repeated concepts, re-runs) render and PNG-encode once:
+    the result lands in a content-keyed cache and every other frame
+    path is hardlinked to it.
+    """
+    frame_path, concept, index, total, frame_in_seq, total_frames_in_seq = args
+
+    resolution = VideoConfig.get_resolution("horizontal")
+    key = hashlib.blake2b(
+        repr((concept, index, total, frame_in_seq,
+              total_frames_in_seq, resolution)).encode(),
+        digest_size=16,
+    ).hexdigest()
+    cache_dir = os.path.join(os.path.dirname(os.path.dirname(frame_path)), "frame_cache")
+    cache_path = os.path.join(cache_dir, f"{key}.png")
+
+    if not os.path.exists(cache_path):
+        # PIL only wraps the finished array for the PNG encode
+        img = Image.fromarray(
+            _build_frame(concept, index, total, frame_in_seq, total_frames_in_seq),
+            'RGB',
+        )
+        # Light PNG compression - frames are ffmpeg input, not archives.
+        # Write via a per-process temp name and an atomic replace so two
+        # workers racing on one key cannot interleave writes
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        img.save(tmp_path, optimize=False, compress_level=1)
+        os.replace(tmp_path, cache_path)
+
+    try:
+        os.link(cache_path, frame_path)
+    except OSError:
+        # Filesystems without hardlink support (some Windows setups)
+        shutil.copy(cache_path, frame_path)
+    return frame_path
+
+
+def render_frame_raw(args: tuple) -> bytes:
+    """Render one frame as raw rgb24 bytes for the ffmpeg stdin pipe."""
+    concept, index, total, frame_in_seq, total_frames_in_seq = args
+    arr = _build_frame(concept, index, total, frame_in_seq, total_frames_in_seq)
+    return arr.tobytes()
+
+
+def _frame_signature(args: tuple) -> tuple:
+    """The visual state a frame's pixels actually depend on.
+
+    Every progress-driven quantity in _build_frame is truncated to an
+    int before it touches pixels - the three gradient offsets and the
+    text slide position. Frames whose truncated values all match are
+    byte-identical even when their raw progress differs, so they only
+    need rendering once. The progress bar is not part of the state:
+    it always painted ACCENT over the already-ACCENT bottom bar.
+    """
+    concept, index, total, frame_in_seq, total_frames_in_seq = args
+    progress = frame_in_seq / total_frames_in_seq
+    return (
+        concept, index, total,
+        int(progress * 40), int(progress * 30), int(progress * 50),
+        int(260 + (-1280 + progress * 1280)),
+    )
+
+# Kokoro loads its model weights on construction (seconds from a cold
+# cache), so one pipeline is shared by every video job in the process.
+# Inference itself is thread-safe - the TTS sentence pool already calls
+# one pipeline from multiple threads
+_tts_pipeline = None
+_tts_pipeline_lock = threading.Lock()
+
+
+def _get_tts_pipeline(lang_code: str):
+    """Lazily build and reuse the Kokoro pipeline for this process."""
+    global _tts_pipeline
+    if _tts_pipeline is None:
+        with _tts_pipeline_lock:
+            if _tts_pipeline is None:
+                from kokoro import KPipeline
+                _tts_pipeline = KPipeline(lang_code=lang_code)
+                logger.info("✅ Kokoro TTS pipeline loaded")
+    return _tts_pipeline
+
+
 # ════════════════════════════════════════════════════════════════════════════════
 # MAIN VIDEO GENERATOR
 # ════════════════════════════════════════════════════════════════════════════════
@@ -326,8 +840,7 @@ class VideoGenerationTask:
             )
             
             script_path = os.path.join(video_dir, "script.txt")
-            with open(script_path, 'w', encoding='utf-8') as f:
-                f.write(title + "\n\n" + script)
+            await asyncio.to_thread(_write_file, script_path, title + "\n\n" + script)
             
             logger.info(f"✅ Script: {len(script)} chars")
             update_video_progress_sync(video_id, step, total_steps, "processing")
@@ -346,8 +859,7 @@ class VideoGenerationTask:
             narration = await self._generate_narration_from_script(title, script)
             
             narration_path = os.path.join(video_dir, "narration.txt")
-            with open(narration_path, 'w', encoding='utf-8') as f:
-                f.write(narration)
+            await asyncio.to_thread(_write_file, narration_path, narration)
             
             logger.info(f"✅ Narration: {len(narration)} chars")
             update_video_progress_sync(video_id, step, total_steps, "processing")
@@ -388,8 +900,9 @@ class VideoGenerationTask:
             )
             
             concepts_path = os.path.join(video_dir, "concepts.json")
-            with open(concepts_path, 'w', encoding='utf-8') as f:
-                json.dump({"concepts": concepts}, f, indent=2, ensure_ascii=False)
+            await asyncio.to_thread(
+                _write_file, concepts_path, _json_dumps_pretty({"concepts": concepts})
+            )
             
             logger.info(f"✅ Concepts: {concepts}")
             update_video_progress_sync(video_id, step, total_steps, "processing")
@@ -405,12 +918,15 @@ class VideoGenerationTask:
             print(f"📍 [STEP {step}/10] Generating visual descriptions...")
             logger.info(f"STEP {step}: Visual descriptions")
             
-            visual_desc = await self._generate_visual_descriptions(
-                narration, title, concepts
+            # Nothing before metadata reads the descriptions, so the
+            # LLM call runs in the background while frames render and
+            # the video encodes
+            visual_desc_task = asyncio.create_task(
+                self._generate_visual_descriptions(narration, title, concepts)
             )
-            
+
             update_video_progress_sync(video_id, step, total_steps, "processing")
-            print(f"✅ [STEP {step}] Visual descriptions created\n")
+            print(f"✅ [STEP {step}] Visual descriptions scheduled\n")
             
             # ════════════════════════════════════════════════════════════════
             # STEP 8: Generate Animated Frames
@@ -422,13 +938,13 @@ class VideoGenerationTask:
             print(f"📍 [STEP {step}/10] Generating animated frames...")
             logger.info(f"STEP {step}: Frame generation")
             
-            frames_dir = await self._generate_visual_frames_with_animations(
+            frame_jobs = await self._generate_visual_frames_with_animations(
                 video_id, concepts, actual_duration, video_dir
             )
-            
-            frame_count = len([f for f in os.listdir(frames_dir) if f.endswith('.png')])
+
+            frame_count = len(frame_jobs)
             update_video_progress_sync(video_id, step, total_steps, "processing")
-            print(f"✅ [STEP {step}] Frames generated ({frame_count})\n")
+            print(f"✅ [STEP {step}] Frames planned ({frame_count})\n")
             
             # ════════════════════════════════════════════════════════════════
             # STEP 9: Compile Video
@@ -441,7 +957,7 @@ class VideoGenerationTask:
             logger.info(f"STEP {step}: Video compilation")
             
             output_path = await self._compile_video(
-                video_id, frames_dir, audio_path, actual_duration, video_dir
+                video_id, frame_jobs, audio_path, actual_duration, video_dir
             )
             
             file_size = os.path.getsize(output_path)
@@ -457,10 +973,12 @@ class VideoGenerationTask:
             
             step = 10
             generation_time = (datetime.now(timezone.utc) - start_time).total_seconds()
-            
+
             update_video_progress_sync(video_id, step, total_steps, "processing")
-            
+
             print(f"📍 [STEP {step}/10] Saving metadata...")
+
+            visual_desc = await visual_desc_task
             
             metadata = {
                 "video_id": video_id,
@@ -486,7 +1004,7 @@ class VideoGenerationTask:
                     "narration_generation": True,
                     "tts_audio": True,
                     "visual_concepts": True,
-                    "visual_descriptions": True,
+                    "visual_descriptions": bool(visual_desc.get("descriptions")),
                     "animated_frames": True,
                     "video_compilation": True
                 },
@@ -494,8 +1012,9 @@ class VideoGenerationTask:
             }
             
             metadata_path = os.path.join(video_dir, "metadata.json")
-            with open(metadata_path, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
+            await asyncio.to_thread(
+                _write_file, metadata_path, _json_dumps_pretty(metadata)
+            )
             
             update_video_progress_sync(video_id, step, total_steps,
                                       status="completed",
@@ -503,14 +1022,14 @@ class VideoGenerationTask:
                                       quality_score=0.95,
                                       completed_at=datetime.now(timezone.utc))
             
-            _completed_videos[video_id] = {
+            _record_completed_video(video_id, {
                 "status": "completed",
                 "output_path": output_path,
                 "file_size": file_size,
                 "duration": actual_duration,
                 "generation_time": generation_time,
                 "completed_at": datetime.now(timezone.utc).isoformat()
-            }
+            })
             
             print("=" * 80)
             print(f"🎉 [COMPLETE] Video generated successfully!")
@@ -541,7 +1060,9 @@ class VideoGenerationTask:
                                       status="failed",
                                       error_message=str(e))
             
-            _completed_videos[video_id] = {"status": "failed", "error": str(e)}
+            _record_completed_video(
+                video_id, {"status": "failed", "error": str(e)}
+            )
             return {"video_id": video_id, "status": "failed", "error": str(e)}
     
     async def _generate_script_from_data(
@@ -565,8 +1086,8 @@ Content: {content[:2000]}
 Return ONLY the script text."""
             
             logger.debug("Generating script")
-            response = model.generate_content(prompt)
-            script = response.text.strip()
+            text = await get_or_generate(model, prompt)
+            script = text.strip()
             
             script = re.sub(r'\*\*(.+?)\*\*', r'\1', script)
             script = re.sub(r'^#+\s+', '', script, flags=re.MULTILINE)
@@ -598,8 +1119,8 @@ Script: {script}
 Return ONLY narration text."""
             
             logger.debug("Generating narration")
-            response = model.generate_content(prompt)
-            narration = response.text.strip()
+            text = await get_or_generate(model, prompt)
+            narration = text.strip()
             
             narration = re.sub(r'\*\*(.+?)\*\*', r'\1', narration)
             narration = re.sub(r'\[.*?\]', '', narration)
@@ -617,21 +1138,47 @@ Return ONLY narration text."""
         try:
             if not narration or len(narration.strip()) == 0:
                 raise Exception("No narration")
-            
+
             audio_path = os.path.join(video_dir, "narration.wav")
-            
+
             print(f"  🎙️ Kokoro TTS (bf_isabella)...")
-            
-            from kokoro import KPipeline
-            
-            pipeline = KPipeline(lang_code=self.config.TTS_LANG)
-            generator = pipeline(narration, voice=self.config.TTS_VOICE)
-            
-            audio_chunks = [audio for gs, ps, audio in generator]
-            full_audio = np.concatenate(audio_chunks) if audio_chunks else np.array([])
-            
-            if len(full_audio) == 0:
+
+            pipeline = _get_tts_pipeline(self.config.TTS_LANG)
+
+            # Sentences synthesize independently and Kokoro's torch ops
+            # release the GIL, so a small thread pool overlaps them;
+            # order is preserved by executor.map
+            sentences = [
+                s for s in re.split(r'(?<=[.!?])\s+', narration) if s.strip()
+            ]
+
+            def _synthesize(sentence: str) -> np.ndarray:
+                chunks = [
+                    audio for gs, ps, audio
+                    in pipeline(sentence, voice=self.config.TTS_VOICE)
+                ]
+                return np.concatenate(chunks) if chunks else np.array([])
+
+            if len(sentences) > 1:
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    pieces = [
+                        p for p in executor.map(_synthesize, sentences)
+                        if len(p)
+                    ]
+            else:
+                pieces = [p for p in map(_synthesize, sentences) if len(p)]
+
+            if not pieces:
                 raise Exception("No audio generated")
+
+            # One preallocated buffer instead of a concatenate over
+            # potentially hundreds of chunks
+            total_samples = sum(len(p) for p in pieces)
+            full_audio = np.empty(total_samples, dtype=pieces[0].dtype)
+            offset = 0
+            for piece in pieces:
+                full_audio[offset:offset + len(piece)] = piece
+                offset += len(piece)
             
             sf.write(audio_path, full_audio, self.config.TTS_SAMPLE_RATE)
             audio_duration = len(full_audio) / self.config.TTS_SAMPLE_RATE
@@ -656,8 +1203,8 @@ Return ONLY concepts, one per line (no numbering).
 Title: {title}
 Narration: {narration[:1500]}"""
             
-            response = model.generate_content(prompt)
-            concepts = [c.strip() for c in response.text.split('\n') if c.strip()]
+            text = await get_or_generate(model, prompt)
+            concepts = [c.strip() for c in text.split('\n') if c.strip()]
             
             return concepts[:num_concepts]
         
@@ -679,8 +1226,8 @@ Concepts: {', '.join(concepts)}
 
 Return only descriptions."""
             
-            response = model.generate_content(prompt)
-            return {"descriptions": response.text.strip()}
+            text = await get_or_generate(model, prompt)
+            return {"descriptions": text.strip()}
         
         except Exception as e:
             logger.error(f"Visual descriptions failed: {e}")
@@ -688,31 +1235,50 @@ Return only descriptions."""
     
     async def _generate_visual_frames_with_animations(
         self, video_id: int, concepts: List[str], duration: float, video_dir: str
-    ) -> str:
-        """Generate animated frames."""
+    ) -> List[tuple]:
+        """Plan the frame jobs for the raw-video encoder pipe.
+
+        Frames are no longer materialized as PNGs on the main path -
+        the encoder consumes raw RGB straight from the renderer, which
+        skips a PNG encode + decode per frame and all of frames_dir's
+        disk I/O. Set DEBUG_SAVE_FRAMES=1 to also write PNGs for
+        inspection (deduplicated through the hardlink cache).
+        """
         try:
-            frames_dir = os.path.join(video_dir, "frames")
-            os.makedirs(frames_dir, exist_ok=True)
-            
             frames_per_concept = self.config.get_frames_per_concept(
                 int(duration), len(concepts)
             )
-            
-            frame_count = 0
+
+            jobs = []
             for concept_idx, concept in enumerate(concepts):
                 for frame_in_seq in range(frames_per_concept):
-                    img = await self._create_animated_frame(
+                    jobs.append((
                         concept, concept_idx + 1, len(concepts),
                         frame_in_seq, frames_per_concept
-                    )
-                    
-                    frame_path = os.path.join(frames_dir, f"frame_{frame_count:05d}.png")
-                    img.save(frame_path)
-                    frame_count += 1
-            
-            logger.info(f"✅ Frames: {frame_count}")
-            return frames_dir
-        
+                    ))
+
+            if os.environ.get("DEBUG_SAVE_FRAMES"):
+                frames_dir = os.path.join(video_dir, "frames")
+                os.makedirs(frames_dir, exist_ok=True)
+                cache_dir = os.path.join(video_dir, "frame_cache")
+                os.makedirs(cache_dir, exist_ok=True)
+
+                loop = asyncio.get_running_loop()
+                with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                    await asyncio.gather(*[
+                        loop.run_in_executor(
+                            executor, render_frame,
+                            (os.path.join(frames_dir, f"frame_{i:05d}.png"), *job),
+                        )
+                        for i, job in enumerate(jobs)
+                    ])
+
+                # Hardlinked frames keep their data; the cache names can go
+                shutil.rmtree(cache_dir, ignore_errors=True)
+
+            logger.info(f"✅ Frames planned: {len(jobs)}")
+            return jobs
+
         except Exception as e:
             logger.error(f"Frame generation failed: {e}")
             raise
@@ -723,103 +1289,121 @@ Return only descriptions."""
     ) -> Image.Image:
         """Create animated frame."""
         try:
-            resolution = self.config.get_resolution("horizontal")
-            img = Image.new('RGB', resolution)
-            pixels = img.load()
-            
-            progress = frame_in_seq / total_frames_in_seq
-            
-            for y in range(resolution[1]):
-                r = int(15 + (progress * 40) + (y // 10 % 30))
-                g = int(23 + (progress * 30) + (y // 8 % 25))
-                b = int(42 + (progress * 50) + (y // 6 % 40))
-                
-                r, g, b = max(0, min(255, r)), max(0, min(255, g)), max(0, min(255, b))
-                
-                for x in range(resolution[0]):
-                    pixels[x, y] = (r, g, b)
-            
-            draw = ImageDraw.Draw(img)
-            draw.rectangle([(0, 0), (resolution[0], 15)], fill=self.config.ACCENT_COLOR)
-            draw.rectangle([(0, resolution[1]-20), (resolution[0], resolution[1])], fill=self.config.ACCENT_COLOR)
-            
-            try:
-                font_large = ImageFont.truetype("C:\\Windows\\Fonts\\arial.ttf", 60)
-                font_small = ImageFont.truetype("C:\\Windows\\Fonts\\arial.ttf", 40)
-            except:
-                font_large = ImageFont.load_default()
-                font_small = font_large
-            
-            slide_distance = -1280 + (progress * 1280)
-            lines = concept.split('\n')
-            y_offset = 300
-            
-            for line in lines:
-                if line.strip():
-                    text_x = int(260 + slide_distance)
-                    draw.text((text_x + 2, y_offset + 3), line[:50], font=font_large, fill=self.config.SHADOW_COLOR)
-                    draw.text((text_x, y_offset + 1), line[:50], font=font_large, fill=self.config.ACCENT_COLOR)
-                    y_offset += 100
-            
-            total_progress = (index - 1 + progress) / total
-            bar_width = int(resolution[0] * total_progress)
-            draw.rectangle([(0, resolution[1]-20), (bar_width, resolution[1])], fill=self.config.ACCENT_COLOR)
-            draw.text((1200, resolution[1]-40), f"{index}/{total}", font=font_small, fill=self.config.TEXT_COLOR)
-            
-            return img
-        
+            return _build_frame(
+                concept, index, total, frame_in_seq, total_frames_in_seq
+            )
+
         except Exception as e:
             logger.error(f"Frame creation failed: {e}")
+            resolution = self.config.get_resolution("horizontal")
             return Image.new('RGB', resolution, color=self.config.BG_COLOR)
     
     async def _compile_video(
-        self, video_id: int, frames_dir: str, audio_path: str,
+        self, video_id: int, frame_jobs: List[tuple], audio_path: str,
         duration: float, video_dir: str
     ) -> str:
-        """Compile video."""
+        """Compile video by streaming raw frames into one ffmpeg pass.
+
+        Frames render in a process pool and pipe into ffmpeg as rawvideo
+        over stdin, so encoding overlaps rendering and neither PNGs nor
+        a silent intermediate mp4 ever touch disk.
+        """
         try:
             output_path = os.path.join(video_dir, "video.mp4")
-            video_temp = os.path.join(video_dir, 'video_no_audio.mp4')
-            
-            os.environ['PATH'] = r"C:\Program Files\FFmpeg\bin" + os.pathsep + os.environ.get('PATH', '')
-            
+
             resolution = self.config.get_resolution("horizontal")
             crf = self.config.get_crf_quality(int(duration))
-            
-            result1 = subprocess.run([
-                'ffmpeg', '-loglevel', 'error',
+
+            cmd = [
+                FFMPEG_BIN, '-loglevel', 'error',
+                '-f', 'rawvideo',
+                '-pixel_format', 'rgb24',
+                '-video_size', f'{resolution[0]}x{resolution[1]}',
                 '-framerate', str(self.config.FPS),
-                '-pattern_type', 'glob',
-                '-i', os.path.join(frames_dir, '*.png'),
-                '-c:v', self.config.VIDEO_CODEC,
-                '-preset', 'medium',
-                '-crf', str(crf),
-                '-pix_fmt', 'yuv420p',
-                '-s', f'{resolution[0]}x{resolution[1]}',
-                '-y', video_temp
-            ], capture_output=True, text=True, timeout=1800)
-            
-            if result1.returncode != 0:
-                raise Exception(f"FFmpeg error: {result1.stderr[:200]}")
-            
-            result2 = subprocess.run([
-                'ffmpeg', '-loglevel', 'error',
-                '-i', video_temp,
+                '-i', 'pipe:0',
                 '-i', audio_path,
-                '-c:v', 'copy',
+                *_h264_encoder_args(
+                    _detect_h264_encoder(), crf, self.config.FPS
+                ),
+                '-pix_fmt', 'yuv420p',
                 '-c:a', self.config.AUDIO_CODEC,
+                '-movflags', '+faststart',
                 '-shortest',
                 '-y', output_path
-            ], capture_output=True, text=True, timeout=600)
-            
-            if result2.returncode != 0:
-                raise Exception(f"FFmpeg error: {result2.stderr[:200]}")
-            
-            if os.path.exists(video_temp):
-                os.remove(video_temp)
-            
+            ]
+
+            def _stream() -> None:
+                # Runs of consecutive frames with the same truncated
+                # visual state are byte-identical: render one per run
+                # and repeat its bytes into the pipe. At high frame
+                # counts this skips a large share of renders for free
+                unique_jobs: List[tuple] = []
+                run_lengths: List[int] = []
+                prev_sig = None
+                for job in frame_jobs:
+                    sig = _frame_signature(job)
+                    if sig == prev_sig:
+                        run_lengths[-1] += 1
+                    else:
+                        unique_jobs.append(job)
+                        run_lengths.append(1)
+                        prev_sig = sig
+
+                proc = subprocess.Popen(
+                    cmd, stdin=subprocess.PIPE, stderr=subprocess.PIPE
+                )
+                # Raw os.write on the fd skips the BufferedWriter's
+                # internal copy; turbopipe additionally writes from a
+                # C++ thread so Python moves on to the next frame
+                fd = proc.stdin.fileno()
+
+                def _write_frame(buf: bytes) -> None:
+                    if turbopipe is not None:
+                        turbopipe.pipe(memoryview(buf), fd)
+                        return
+                    view = memoryview(buf)
+                    while view:
+                        view = view[os.write(fd, view):]
+
+                # Drain stderr on its own thread while frames stream in;
+                # if ffmpeg fills the stderr pipe buffer mid-encode it
+                # stops reading stdin and the frame writes deadlock
+                stderr_chunks: List[bytes] = []
+                stderr_reader = threading.Thread(
+                    target=lambda: stderr_chunks.append(proc.stderr.read()),
+                    daemon=True,
+                )
+                stderr_reader.start()
+
+                try:
+                    # executor.map yields in order while workers render
+                    # ahead, so the encoder is fed without stalls
+                    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                        for frame_bytes, repeats in zip(
+                            executor.map(
+                                render_frame_raw, unique_jobs, chunksize=8
+                            ),
+                            run_lengths,
+                        ):
+                            for _ in range(repeats):
+                                _write_frame(frame_bytes)
+                    if turbopipe is not None:
+                        turbopipe.sync()
+                    proc.stdin.close()
+                except BrokenPipeError:
+                    # ffmpeg died early - fall through to the error check
+                    pass
+                returncode = proc.wait(timeout=1800)
+                stderr_reader.join(timeout=30)
+                stderr = stderr_chunks[0] if stderr_chunks else b""
+                if returncode != 0:
+                    raise Exception(
+                        f"FFmpeg error: {stderr.decode(errors='replace')[:200]}"
+                    )
+
+            await asyncio.to_thread(_stream)
             return output_path
-        
+
         except Exception as e:
             logger.error(f"Compilation failed: {e}")
             raise
@@ -829,6 +1413,37 @@ Return only descriptions."""
 # BACKGROUND THREADING
 # ════════════════════════════════════════════════════════════════════════════════
 
+# One long-lived loop on a dedicated thread runs every video job; a
+# semaphore bounds how many generate concurrently so bursty requests
+# queue instead of racing ffmpeg/TTS for the same CPU and memory
+_video_loop: Optional[asyncio.AbstractEventLoop] = None
+_video_loop_lock = threading.Lock()
+_video_semaphore: Optional[asyncio.Semaphore] = None
+_MAX_CONCURRENT_VIDEOS = 2
+
+
+def _get_video_loop() -> asyncio.AbstractEventLoop:
+    """Start the shared video worker loop on first use."""
+    global _video_loop, _video_semaphore
+    with _video_loop_lock:
+        if _video_loop is None:
+            _video_loop = asyncio.new_event_loop()
+            _video_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_VIDEOS)
+            thread = threading.Thread(
+                target=_video_loop.run_forever,
+                daemon=True,
+                name="video-generation",
+            )
+            thread.start()
+    return _video_loop
+
+
+async def _generate_bounded(**kwargs) -> dict:
+    async with _video_semaphore:
+        task = VideoGenerationTask()
+        return await task.generate_video(**kwargs)
+
+
 def run_video_generation_in_thread(
     video_id: int,
     title: str,
@@ -837,35 +1452,28 @@ def run_video_generation_in_thread(
     duration: int,
     custom_prompt: str = None,
 ):
-    """Schedule video generation."""
-    
-    def _generate():
+    """Schedule video generation on the shared worker loop."""
+    loop = _get_video_loop()
+    future = asyncio.run_coroutine_threadsafe(
+        _generate_bounded(
+            video_id=video_id,
+            title=title,
+            sources=sources,
+            channel_id=channel_id,
+            duration=duration,
+            custom_prompt=custom_prompt,
+        ),
+        loop,
+    )
+
+    def _log_result(fut):
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            task = VideoGenerationTask()
-            
-            result = loop.run_until_complete(
-                task.generate_video(
-                    video_id=video_id,
-                    title=title,
-                    sources=sources,
-                    channel_id=channel_id,
-                    duration=duration,
-                    custom_prompt=custom_prompt,
-                )
-            )
-            
+            fut.result()
             logger.info(f"✅ Video {video_id} complete!")
-        
         except Exception as e:
-            logger.error(f"Thread error: {e}", exc_info=True)
-        finally:
-            loop.close()
-    
-    thread = threading.Thread(target=_generate, daemon=True)
-    thread.start()
+            logger.error(f"Video {video_id} failed: {e}", exc_info=True)
+
+    future.add_done_callback(_log_result)
     logger.info(f"✅ Video {video_id} scheduled!")
 
 
@@ -0,0 +1,67 @@
+"""
+LLM response cache for Gemini prompts.
+
+Pipeline runs on the same or similar topics rebuild identical prompts
+for scripts, narration, concepts, and descriptions; caching responses
+keyed by the normalized prompt turns repeat calls into cache hits -
+milliseconds instead of seconds, and no API cost.
+"""
+
+import asyncio
+import hashlib
+import logging
+import re
+
+from app.config import settings
+from app.services.cache_service import get_cache_service
+
+logger = logging.getLogger(__name__)
+
+# Prompts embed user content, so entries age out rather than live forever
+_LLM_CACHE_TTL = 7 * 24 * 3600
+
+_WS_RE = re.compile(r"\s+")
+
+
+def _cache_key(prompt: str, model_name: str) -> str:
+    """Key on the whitespace-normalized prompt plus model name."""
+    normalized = _WS_RE.sub(" ", prompt.strip())
+    digest = hashlib.sha256(f"{model_name}|{normalized}".encode()).hexdigest()
+    return f"llm:{digest}"
+
+
+async def get_or_generate(model, prompt: str, model_name: str = None) -> str:
+    """
+    Return the cached response for a prompt, generating on miss.
+
+    The generate_content call runs in a worker thread so it never
+    blocks the event loop; responses are stored through the shared
+    cache service (Redis when available).
+
+    Args:
+        model: genai.GenerativeModel instance
+        prompt: Full prompt text
+        model_name: Model identifier for the key (defaults to settings)
+
+    Returns:
+        Response text
+
+    Example:
+        ```
+        text = await get_or_generate(model, prompt)
+        ```
+    """
+    model_name = model_name or settings.GEMINI_API_MODEL
+    key = _cache_key(prompt, model_name)
+    cache = get_cache_service()
+
+    cached = await cache.get(key)
+    if cached is not None:
+        logger.debug("✅ LLM cache hit")
+        return cached
+
+    response = await asyncio.to_thread(model.generate_content, prompt)
+    text = response.text
+
+    await cache.set(key, text, ttl=_LLM_CACHE_TTL)
+    return text
@@ -1,12 +1,17 @@
 """Initialize database tables."""
 
-from app.db.database import Base, engine
-from app.models.video import Video
-from app.models.source import Source
-from app.models.embedding import Embedding
-from app.models.concept import Concept
-from app.models.relationship import VideoRelationship, ConceptRelationship
+import asyncio
+
+from app.db.database import init_db, close_db
+
+
+async def main():
+    # One connection, one event loop: generate_schemas(safe=True)
+    # emits CREATE TABLE IF NOT EXISTS for every model in a single pass
+    await init_db()
+    await close_db()
+
 
 if __name__ == "__main__":
-    Base.metadata.create_all(bind=engine)
+    asyncio.run(main())
     print("✅ Tables created successfully")
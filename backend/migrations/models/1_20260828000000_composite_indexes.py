@@ -0,0 +1,53 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_videos_channel_status_created" ON "videos" ("channel_id", "status", "created_at" DESC);
+DROP INDEX IF EXISTS "idx_videos_channel_4264d0";
+CREATE INDEX IF NOT EXISTS "idx_generation_jobs_video_status" ON "generation_jobs" ("video_id", "status");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_generation_jobs_video_status";
+CREATE INDEX IF NOT EXISTS "idx_videos_channel_4264d0" ON "videos" ("channel_id");
+DROP INDEX IF EXISTS "idx_videos_channel_status_created";"""
+
+
+MODELS_STATE = (
+    "eJztnFtT2zgUx7+Kx0/sDGXaLNDOvgUIlE4gDEm73TKMR7GVxIstGVleyLb97ivJd/mCnU"
+    "2CnfqtkfQ30k+3c46kfldtbEDLPThdAAJ0Con6h/JdRcCG7B/ZzH1FBY4TZ/EECqaWKK2H"
+    "xUQymLqU/2Q5M2C5kCUZ0NWJ6VATI14++qwiPqbMMFH+MQ2IlTlEkABe7oB/ysA6+5aJ5r"
+    "VUHjIfPahRPId0IRp2d8+STWTAZ+iGP50HbWZCy0i12zT4B0S6RpeOSLtE9FwU5BWaajq2"
+    "PBvFhZ0lXWAUlTYR5alBlSD/PCUeh4A8ywqIhVz8msZF/ComNAacAc/iKLk6QzJMTGAKkn"
+    "SMeC+w2riigXP+V9703h2+P/zw+/HhB1ZE1CRKef/Tb17cdl8oCFxP1J8iH1DglxAYY25s"
+    "BCAELS2PH++3fIBplQSSVV8GGWIrIxkmbA6lDZ41C6I5XbCf796+LQH3pX97+rF/u8dK/c"
+    "Ybg9kA9qfMdZDV8/M43RRNf6RrIqUeUUm5Karx1N4E1t7RUQWsrFQhVpGXxmraYA41B7C/"
+    "UANpWtVOnEeVRulRySg9yo5SG1LAF4QszE/j0XU+zKRGQvkZsSbeGaZO9xXLdOl9BbDB1N"
+    "4i1xKMvNW8zrbrPlpJentX/a8y2NPh6ERAwC6dE/EV8YETeSkgkDdfAzSL+YzlUNOGBUtB"
+    "SinBNgLpQfiPho5i1gZjhKxl0Ncl9CeXV4PxpH91k+qCs/5kwHN6InUppe4dS90SfUT583"
+    "LyUeE/lW+j64HcU1G5yTeV1wl4FGsIP2nASOw4YWoIJtWxnmOs2LFpZdexr9qxovLcnJw9"
+    "JAwjnjAF+sMTIIaWycE9XFQ2m2X3bDkFILYjGQFbXsvAWr+IzOBPeKrmmPPpAqUmfWxSa3"
+    "/jaUW7/oQ1Y06wh4yESa4wvcKFD2xAZK36ipqXbfo7VTgDgTHpUkA9V73vLP01W/pJyBXp"
+    "JSUvM2yGkb8WijE1Np5r+kaxYj0m58bH3ebt92BO14AYK7Znt6sORAYntT7jvZLtXmK6yy"
+    "AdgvmGl4OycA4nJZuaw1mWb5szgyEhmGg2Q8A23yy4CXwuIJcRrjQUG+XpTAZfJ+WeTmSR"
+    "DUfXF2Fx2f3pPJ0dNIg7T2dHO7ZJns4Ye0SHao6LE+Tsl/k2rihT0afxP6iwjvZsiGhw9v"
+    "BGOR1d3QwHk4FyfjkYno2zjk0dYXdisXU/ZmYyA6tmdD2paWcgeCN2Ocfig6jJMhK1FGYV"
+    "w7xXbJj3Moa5gFL3gCIlaolxuYXjCYHFNf/NGZWF62NKs5Kb8woo1+zosM9TiHJstWIXJy"
+    "Fpy0zetnfjerYNyLIO1YSkJbN661AbGBDKmEEtiAd1sY0ND1QLoLmXy7Z4qCY1W4xeQrS2"
+    "gfqu2tWYkpsxmcAlv4qhYy9veyoOXaZEv+iu/oSZz12XXFr0S4Z9u6jkTgSvuqjkjnZsk6"
+    "KSX/g5t5oTlPQz9stikuKMvGJIUnxO4ZGtKXBhFFgcjk77Q2U8Gd32LwbK6Hr4VzYoWU9a"
+    "5dJF+g5vbF8nlr/uEsa6g5fUpFYtYzIStPKS9UailsmaZUgWuzySrHN4ch0ew/MvctWY3k"
+    "nJ9kzN4ybZmg1+RJHjKbItGwKiLzQHOMHTH2mjkkr8cB2gQw0+Oxb2+/rHlNMkmGpzApAx"
+    "A3ybiRNdiokJ3R8PpuFqYaq8p73eKw0GdI7Jsv4jDVnYkkVEPv2odvxRdv5RzHSVxwW54u"
+    "6VgWRi574yiB7waZ4Lc5afEuhZaYe8CnKPrW625hBsO/UOW2RhS1aPbZsgPiAGDs3MeZ3l"
+    "OSNsCeBNnxJ0py3d7dvu9u2OrpbYo45Ha989kWQtgbuF2yd04dlTBEyrNtKssqMabUGiXr"
+    "WRSrKOZ8gz8covPKtIMz23MChYWXO0EtgZFzcSbQnJs9Hnk+FAubkdnF6OLwPDPzrfEJki"
+    "0P1omVS08nbQH3ZXz9ayyz96gFFdaq6OSb3BmFGuOBRXs5MO/oeltOGh2J1f78QxZ3d+va"
+    "MdG1Q+ef3Wdiy44pSVtGvo20btzU3qyrDZmUnakMsIfUhMfaHm3EYIcvbLriOAuMxL1xGK"
+    "O7Z71bT9/50BEjf32LXYOUpI2nJ5fwu3A/jUqAExKN5OgJs5HS16RlJylFT4jGSVI6RmPS"
+    "pZ2xnSq24vP/8DByns4A=="
+)
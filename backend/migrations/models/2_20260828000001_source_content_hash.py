@@ -0,0 +1,65 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "sources" ADD COLUMN IF NOT EXISTS "content_hash" VARCHAR(64);
+CREATE UNIQUE INDEX IF NOT EXISTS "uid_sources_content_hash" ON "sources" ("content_hash");
+CREATE INDEX IF NOT EXISTS "idx_sources_created_at" ON "sources" ("created_at");
+CREATE TABLE IF NOT EXISTS "source_embeddings" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "source_id" INT NOT NULL,
+    "chunk_index" INT NOT NULL DEFAULT 0,
+    "embedding" JSONB NOT NULL,
+    "created_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS "idx_source_embeddings_source" ON "source_embeddings" ("source_id");
+COMMENT ON TABLE "source_embeddings" IS 'Per-chunk embedding vector for a source document.';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "source_embeddings";
+DROP INDEX IF EXISTS "idx_sources_created_at";
+DROP INDEX IF EXISTS "uid_sources_content_hash";
+ALTER TABLE "sources" DROP COLUMN IF EXISTS "content_hash";"""
+
+
+MODELS_STATE = (
+    "eJztXF1T2zgU/SuePHVngGmzQDv7FiCldAJhIO122+l4FFtJvNiSkeWWtPDfV5K/5Q/sbG"
+    "xs8BtIOkI6upbOvbri98DCOjSdveMVIECjkAz+Un4PELAg+yFduaMMgG1HVbyAgrkpWmtB"
+    "M1EM5g7lv7KaBTAdyIp06GjEsKmBEW8fdquIzpQFJsoPQ4dYWUIECeDt9nhXOtZYXwZaVk"
+    "K5yLh1oUrxEtKVmNi376zYQDq8g07wq32jLgxo6ol5GzrvQJSrdG2LsjNE34uGfEBzVcOm"
+    "a6Gosb2mK4zC1gaivNQfEuTdU+JyEpBrmj5jAS/eSKMm3hBjGB0ugGtyKjk6xWRQGKPJL9"
+    "Iw4qvARuOICS75X9kdvtl/u//uz8P9d6yJGElY8vbBm140dw8oGLiYDR5EPaDAayFojHhj"
+    "FoAQNNUs/vi6ZROYRElEsuHLRAa0FTEZFNRHpQXuVBOiJV2xX9+8fl1A3OfR1fGH0dUr1u"
+    "oPPhnMDNj7ZC78qqFXx9lNsOlZuipKqjEqIetiNfq066B1eHBQglbWKpdWUZek1bDAEqo2"
+    "YH+hAqVJVDfpPChlpQcFVnqQtlILUsA3hDSZH6+nF9lkxjESlZ8Qm+I33dDojmIaDv1egl"
+    "j/026Q1wIa+az5mC3HuTXj7L06H32RiT2eTI8ECdihSyJ6ER0cyVsBgXz6KqBpmk9YDTUs"
+    "mLMVJJAS2boP3Qt+aKkVsznoU2Su/bUuYH92dj6+no3OLxNLcDKajXnNUJSupdJXh9KyhJ"
+    "0of5/NPij8V+Xr9GIsr1TYbvZ1wMcEXIpVhH+qQI+dOEFpQExiYV1b33Bhk8h+YZ90YcXg"
+    "uZxc3MSEES+YA+3mJyC6mqrBQ5zXNl1lDS25BCB2Iuk+t3yUvlo/DWXwRzwfZMj5ZINCSR"
+    "9JavVfPC+p64/YNJYEu0iPSXKF4RUOvGEGkVb1JTGPa/pvA+EM+GLSoYC6zuB7r/S3rPTj"
+    "JJdkLw55nMN2iPytsBixxuy5om8UIbYjOWu3u/r1u/9NVyAxQjSn2wc2RDpnanvivZR2L5"
+    "DuMpE2wfzAy6Ay9xuOQ+r6htNcvm7PFwwJwUS1GAXs8E0TN4N3OcylgBuZYqs8ndn4y6zY"
+    "0wkV2WR6cRo0l92f3tN5hoK493Se6cK2ydO5xi7R4CDDxfFrdop8G0e0KenTeB0qbKFdCy"
+    "Lq3z3sKsfT88vJeDZW3p+NJyfXacemCrCMdxPb5XqvZttezcJgcqtirD2O6WZYuBaVzmnx"
+    "iKjIZQjqKJllZPowX6YPUzJdkFL1uiIB6ojUbOCyQtDiGL8yrDJ3f0xgNnJ6noDKLbs9rH"
+    "vKTi91BZxKZijjtmKJzcYwDvdLmOHhfq4V8qpMMqt4jzFIV7bFph1Hx7UsQNZVWI1BOrJF"
+    "Nk5qC2Ntqa+9A6G2PmxUs6GaAC3dTG7zTTWOaTAwDNHWDPVNuayjgqSjVEyYZ7lo2M06nv"
+    "KjwgnQC5VIPzHRKzOXBL3IiHof8H0WccE+4PtMF7Z9Ad+xNYe67pGfE/mNmuw8HgJWYdC6"
+    "ZDD4EpJdbeWiGyVEKj+gRjER2ehAcZJB33RUeKMe+oT2xgPCvoFUoi+BeaGJLsK2VTHcCs"
+    "xJqBcph2B85yqbT50AbSGhul3hoj6julcnxbKzJfLkM89wzBIlXkWhFBHZkSX1h+hO4YfW"
+    "HDgwvFKeTI9HE+V6Nr0anY6V6cXkn7TwqAYtdSGdeL0Vhf/6i+oadQk1qFkp1hUCOvm8rp"
+    "Yb6vjIUkzmR2QlWB+PzYzH6q6Xwl/h845DmpN+hy3Sfm1+PpsRyGZnNgREW6k2sP1H39JB"
+    "JbW4d2zA3e0728TeWt/POZsEU3VJANIXgB8zUaHDHGIDOvc3hu6oQal8ppULlNfxPpcRus"
+    "RkXf15rgzsyCYiZ7qUS3UpynXJ53STZ6WZ4P596U4Jbyj81w2q68CM7aeA9DS0p7wM5S7b"
+    "3SzVJtiyq+WCyMCO7B5NSxCPIEYcWhgZ0ZT87TkF7AjBdScx9Mkg/burJwuL9gk09e6W2K"
+    "W2SyvnGUuwjpDbQKYxXbnWHAHDrExpGtmzGh5BYlyVKZVgPZ8Bn7H/7xBcViQ5fW9ikLOz"
+    "ZmAlYhcc3EpqC5g8mX46moyVy6vx8dn1mS/8wwsOUSkC3bemQcUsr8ajSf/MYCun/K0LGK"
+    "tr1dEwqWaMKeSGpriZTtr7H0qpZlPs7zmf0T1nn1737BbWH3z8dZBlm3DDT1bCbmFtW3U2"
+    "t2kpg2m3NRlhBImhrQYZ2Qh+zU5ROgKI2jyWjpC/sH3CYvP/lwsSJ/PaNd85ikG68rawge"
+    "wA/mlUINFv3k0C67kdzXvlWnCVlPvKtU9iDO+QnvR4efgPqL8g/w=="
+)
@@ -0,0 +1,51 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_videos_status_created" ON "videos" ("status", "created_at");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_videos_status_created";"""
+
+
+MODELS_STATE = (
+    "eJztXFtT2zgU/iuePHVnUqbNAu3sW4C0pRMIA2m3W6bjUWwl8WJLRpYL6eW/ryTf5Qt2Nj"
+    "Y2+A2k8wnp07H06eiInwML69B09o7XgACNQjL4S/k5QMCC7Id05VAZANuOqngBBQtTWGuB"
+    "mSgGC4fyX1nNEpgOZEU6dDRi2NTAiNuHzSqiMWWJifLd0CFWVhBBArjdHm9Kxxpry0CrSi"
+    "gXGbcuVCleQboWA7v+xooNpMN76AS/2jfq0oCmnhi3ofMGRLlKN7YoO0X0nTDkHVqoGjZd"
+    "C0XG9oauMQqtDUR5qd8lyJunxOUkINc0fcYCXryeRiZeF2MYHS6Ba3IqOTrFZFAYo8kv0j"
+    "Dis8B644gBrvhfeTl6vf9m/+2fh/tvmYnoSVjy5rc3vGjsHlAwcD4f/Bb1gALPQtAY8cY8"
+    "ACFoqln88XnLJjCJkohk3ZeJDGgrYjIoqI9KC9yrJkQruma/vn71qoC4z+PL4w/jyxfM6g"
+    "8+GMwc2Ptkzv2qkVfH2U2w6Xm6KkqqMSoh62I1+rTroHV0cFCCVmaVS6uoS9JqWGAFVRuw"
+    "v1CB0iSqm3QelPLSgwIvPUh7qQUp4AtCmsyPV7PzbDLjGInKT4gN8Vo3NDpUTMOh30oQ63"
+    "/aDfJaQCMfNe+z5Ti3Zpy9F2fjLzKxx9PZkSABO3RFRCuigSN5KSCQD18FNE3zCauhhgVz"
+    "loIEUiJb96F7wQ8t9WI2Bn2GzI0/1wXsz0/PJlfz8dlFYgpOxvMJrxmJ0o1U+uJQmpawEe"
+    "Xv0/kHhf+qfJ2dT+SZCu3mXwe8T8ClWEX4TgV6bMcJSgNiEhPr2vqWE5tE9hP7qBMrOs/l"
+    "5PImJox4wQJoN3eA6GqqBo9wnm26yhpZcglAbEfSfW55L321/j6UwR/xYpAh55MGhZI+kt"
+    "Tqv3hRUtcfsWGsCHaRHpPkCsMrHHjDHCKt6ktiHtb01wNxGPDFpEMBdZ3Bt17p71jpx0ku"
+    "yV4c8jCH7RD5O2ExYo35c8WzUYTYjeSs3e/q1+/+N12BxAjRnG4f2BDpnKndifdS2r1Aus"
+    "tE2gTzDS+DytxvOA6p6xtOc/mqPV8wJAQT1WIUsM03Tdwc3ucwlwJu5YqtOunMJ1/mxSed"
+    "UJFNZ+fvA3P5+NOfdJ6gIO5POk90Ytt00rnCLtHgIOOI49cMi842jrApeabxGlTYRLsWRN"
+    "S/e3ipHM/OLqaT+UR5dzqZnlylDzZVgGVON7FVrj/V7PpUszSY3KoYa49juhkWrkWlc1o8"
+    "IipyGYI6SmYZmT7Kl+mjlEwXpFS9rkiAOiI1G7isELQ4xo8Mr8xdHxOYrQ49j0Dljo89rH"
+    "nKdi91DZxKbijjduKJzcYwDvdLuOHhfq4X8qpMMqucHmOQriyLTR8cHdeyANlUYTUG6cgS"
+    "2TipLYy1pb72DoTa+rBRzY5qArRyM7nNd9U4psHAMEQ7c9TX5bKOCpKOUjFhnuWiYTdre8"
+    "qPCidAz1Qi3WGiV2YuCXqWEfU+4Psk4oJ9wPeJTmz7Ar4TawF13SM/J/IbmQwfDgGrMLAu"
+    "GQy+gOSltnbRjRIile9Qo5iIbHSgOMmgbzoqvFULfUJ74wFh30Eq0ZfAPNNEF+HbquhuBe"
+    "Yk1LOUQzC+cpXNp06AdpBQ3a5wUZ9R3auTYtnZEnnymWc4ZokSr6JQiojsyJL6QzSn8E1r"
+    "ARwYXilPZ8fjqXI1n12O30+U2fn0n7TwqAYtcyEdBfziV9ND5Vp615Vt1yuWHSsWalCzUh"
+    "QsBHTy4V0td9fxnqWYzI/VSrA+UpsZqdVdL7m/wucdhzQnCg9bpArb/LA2I8TNdnMIiLZW"
+    "bWD7z8GlLUyy+OXYgB/E720Te3P9a8HZJJiqKwKQvgR8A4oKHXZUNqDz68bQHTUolXe7ci"
+    "H0Ol7uMkJXmGyqP9yVgR1ZROQcmHJJMEVZMPmcbvPgNBPcvzwdljgnhf/UQXUdmLH8FJCe"
+    "hvaUl6HcZaubpdoEW3a1LBEZ2JHVo2kJ4hHEiENLIyPOkr88p4AdIbju9IY+TaR/kfVoAd"
+    "M+tabe1RK71HZp5QxkCdYRchvIQaZr11ogYJiVKU0je1bDLUj0qzKlEqznM+Az9p8fgmuM"
+    "JKfvTAxyVtYMrETskoNbSW0BkyezT0fTiXJxOTk+vTr1hX949SEqRaD71jSoGOXlZDztHy"
+    "DsZJe/dQFjdaM6GibVnDGF3NIVt9NJe/9DKdXsiv0N6BO6Ae0T757cxPqdj78bsmwTbvnJ"
+    "StgdzG2r9uY2TWUw7LamKYwhMbT1ICNPwa8ZFiUqgMjmoUSF/IntUxmb/49dkDiZ1675h6"
+    "MYpCuvDhvIDuCfRgUSffNuEljP7Wje+9eCq6Tc9699emN4h/So28vv/wAryCmH"
+)
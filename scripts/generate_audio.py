@@ -26,18 +26,19 @@ try:
         print(f"🎤 Testing voice: {voice}")
         try:
             generator = pipeline(narration, voice=voice)
-            
-            audio_chunks = []
-            for gs, ps, audio in generator:
-                audio_chunks.append(audio)
-            
-            full_audio = np.concatenate(audio_chunks)
             sr = 24000
-            
+
+            # Stream chunks straight to disk - no chunk list in memory
+            # and no big concatenate at the end
             wav_path = os.path.join(output_dir, f"test_{voice}.wav")
-            sf.write(wav_path, full_audio, sr)
-            
-            duration = len(full_audio) / sr
+            total_samples = 0
+            with sf.SoundFile(wav_path, 'w', samplerate=sr,
+                              channels=1, subtype='PCM_16') as f:
+                for gs, ps, audio in generator:
+                    f.write(audio)
+                    total_samples += len(audio)
+
+            duration = total_samples / sr
             size = os.path.getsize(wav_path)
             print(f"   ✅ Saved: {wav_path} ({duration:.1f}s, {size} bytes)\n")
             
@@ -1,36 +1,28 @@
 # test_setup.py
+import shutil
 import subprocess
 import os
 import numpy as np
 
 print("✅ Testing setup...\n")
 
-# Test 1: FFmpeg - use full path or system
+# Test 1: FFmpeg - resolve the binary once instead of probing PATH twice
 try:
-    # Try system ffmpeg first
-    result = subprocess.run(['ffmpeg', '-version'], 
-                          capture_output=True, 
+    ffmpeg_path = shutil.which('ffmpeg') or r"C:\Program Files\FFmpeg\bin\ffmpeg.exe"
+    result = subprocess.run([ffmpeg_path, '-version'],
+                          capture_output=True,
                           text=True,
                           timeout=5)
     if result.returncode == 0:
         print(f"✅ FFmpeg: {result.stdout.split()[2]}")
     else:
-        raise Exception("ffmpeg not in PATH")
-except:
-    try:
-        # Try full path
-        ffmpeg_path = r"C:\Program Files\FFmpeg\bin\ffmpeg.exe"
-        result = subprocess.run([ffmpeg_path, '-version'], 
-                              capture_output=True, 
-                              text=True,
-                              timeout=5)
-        print(f"✅ FFmpeg: Found at {ffmpeg_path}")
-    except Exception as e:
-        print(f"❌ FFmpeg failed: {e}")
+        raise Exception(f"ffmpeg returned {result.returncode}")
+except Exception as e:
+    print(f"❌ FFmpeg failed: {e}")
 
 # Test 2: espeak-ng
 try:
-    espeak_path = r"C:\Program Files\eSpeak NG\espeak-ng.exe"
+    espeak_path = shutil.which('espeak-ng') or r"C:\Program Files\eSpeak NG\espeak-ng.exe"
     result = subprocess.run([espeak_path, "Hello"], capture_output=True, text=True, timeout=5)
     print(f"✅ espeak-ng: Working")
 except Exception as e:
@@ -45,17 +37,15 @@ try:
     print("Generating audio...")
     generator = pipeline("Hello world, this is a test.", voice="af_heart")
     
-    # Kokoro returns a GENERATOR - collect all audio chunks
-    audio_chunks = []
+    # Kokoro returns a GENERATOR - count samples without buffering chunks
+    total_samples = 0
     for i, (gs, ps, audio) in enumerate(generator):
-        audio_chunks.append(audio)
+        total_samples += len(audio)
         print(f"  Chunk {i}: {audio.shape if hasattr(audio, 'shape') else len(audio)}")
-    
-    # Concatenate all chunks
-    full_audio = np.concatenate(audio_chunks)
+
     sr = 24000
-    
-    print(f"✅ Kokoro: Working (audio shape: {full_audio.shape}, sample rate: {sr}Hz)")
+
+    print(f"✅ Kokoro: Working ({total_samples} samples, sample rate: {sr}Hz)")
 except Exception as e:
     print(f"❌ Kokoro failed: {e}")
     import traceback